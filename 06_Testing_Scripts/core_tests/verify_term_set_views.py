@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Verify the array views of the T-sets against build_term_sets / aux_keygen.
+Includes T-depth >= 4, where T[ℓ-1] repeats terms and equal pairs are skipped.
+Run from the repository root.
+"""
+
+import sys
+import random
+import logging
+sys.path.insert(0, 'core')
+
+from key_generation import (aux_keygen, aux_keygen_sizes, build_term_factor_counts, build_term_sets,
+                            evaluate_term, evaluate_term_sets)
+
+logging.getLogger('key_generation').setLevel(logging.WARNING)
+
+CONFIGS = [(2, 4), (3, 3), (1, 5)]
+
+def expected_factor_count(term):
+    """Number of base variables multiplied together in a term string."""
+    return term.count('*') + 1
+
+def test_factor_counts(num_qubits, t_depth):
+    """build_term_factor_counts and cross counts vs the term strings"""
+    T_sets, _, cross_counts = build_term_sets(num_qubits, t_depth, return_cross_counts=True)
+    factor_counts = build_term_factor_counts(num_qubits, t_depth)
+
+    ok = True
+    for ell, terms in T_sets.items():
+        counts = factor_counts[ell].tolist()
+        if counts != [expected_factor_count(term) for term in terms]:
+            print(f"  ❌ T[{ell}]: factor counts differ ({len(counts)} counts, {len(terms)} terms)")
+            ok = False
+        num_cross = sum(1 for term in terms if '*' in term)
+        if cross_counts[ell] != num_cross:
+            print(f"  ❌ T[{ell}]: cross_counts={cross_counts[ell]}, expected {num_cross}")
+            ok = False
+    return ok
+
+def test_keygen_sizes(num_qubits, t_depth):
+    """aux_keygen_sizes vs the states aux_keygen actually prepares"""
+    _, _, _, layer_sizes, total_aux = aux_keygen(num_qubits, t_depth, [1] * num_qubits, [0] * num_qubits)
+    sizes = aux_keygen_sizes(num_qubits, t_depth)
+
+    expected = {ell: num_qubits * size for ell, size in enumerate(layer_sizes, start=1)}
+    ok = sizes == expected and sum(sizes.values()) == total_aux
+    if not ok:
+        print(f"  ❌ aux_keygen_sizes={sizes}, aux_keygen={expected} (total {total_aux})")
+    return ok
+
+def test_term_values(num_qubits, t_depth):
+    """evaluate_term_sets vs evaluate_term for every term"""
+    T_sets, _ = build_term_sets(num_qubits, t_depth)
+
+    rng = random.Random(42)  # Fixed seed for reproducible test
+    variable_values = {term: rng.randint(0, 1) for term in T_sets[1]}
+    for ell in range(2, t_depth + 1):
+        for i in range(num_qubits):
+            for j in range(len(T_sets[ell-1])):
+                variable_values[f"k{i}_{j}_L{ell-1}"] = rng.randint(0, 1)
+
+    values = evaluate_term_sets(T_sets, variable_values)
+
+    ok = True
+    for ell, terms in T_sets.items():
+        expected = [evaluate_term(term, variable_values) for term in terms]
+        mismatches = sum(1 for got, want in zip(values[ell].tolist(), expected) if got != want)
+        if len(values[ell]) != len(terms) or mismatches:
+            print(f"  ❌ T[{ell}]: {mismatches} of {len(terms)} values differ ({len(values[ell])} values)")
+            ok = False
+    return ok
+
+if __name__ == "__main__":
+    print("="*80)
+    print("T-SET ARRAY VIEW VERIFICATION")
+    print("="*80)
+
+    success = True
+    for num_qubits, t_depth in CONFIGS:
+        print(f"\n{num_qubits}q-{t_depth}t:")
+        for check in (test_factor_counts, test_keygen_sizes, test_term_values):
+            passed = check(num_qubits, t_depth)
+            print(f"  {'✅' if passed else '❌'} {check.__doc__}")
+            success = success and passed
+
+    print(f"\n{'='*80}")
+    print("✅ All T-set views match" if success else "❌ T-set views differ!")
+    print(f"{'='*80}")
+    sys.exit(0 if success else 1)
@@ -11,8 +11,13 @@ import logging
 import subprocess
 import psutil
 import time
+import math
 import numpy as np
+from collections import deque
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
 from qiskit import QuantumCircuit, ClassicalRegister
+from numba_compat import njit
 from qiskit_ibm_runtime import QiskitRuntimeService, SamplerV2 as Sampler, SamplerOptions
 
 # Import our corrected modules
@@ -27,6 +32,19 @@ from openqasm3_integration import integrate_openqasm3_with_aux_qhe
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Table separator, sliced to the width of each table header
+SEP = "-" * 200
+
+# Distributions are aligned as dense 2**n arrays only while 2**n is at most this
+# many times their combined number of keys (each has at most `shots` keys);
+# sparser registers are aligned over the union of their keys instead
+_DENSE_MAX_FILL_RATIO = 4
+
+# Row templates for the noise and memory tables, parsed once at import
+_IBM_ROW_FMT = "{}\t\t| {}\t| {}\t| {:.4f}\t\t| {:.4f}\t\t| {:.4f}\t\t| {:.4f}\t\t| {:.4f}\t\t| {:.2f}\t\t\t| {:.2f}".format
+_MOCK_ROW_FMT = "{}\t\t| {}\t| {}\t| {:.4f}\t\t| {:.4f}\t\t| {:.4f}\t\t| {:.4f}\t\t| {:.2f}".format
+_MEM_ROW_FMT = "{}\t| {}\t\t| {}\t\t| {:.2f}\t\t\t| {:.2f}\t\t\t| {:.1f}\t\t\t| {}".format
+
 class MemoryMonitor:
     """Memory monitoring class for tracking auxiliary state memory usage."""
     
@@ -34,7 +52,7 @@ class MemoryMonitor:
         self.process = psutil.Process()
         self.initial_memory = self.get_memory_usage()
         self.peak_memory = self.initial_memory
-        self.memory_history = []
+        self.memory_history = deque(maxlen=256)  # Bounded so long sweeps don't grow it unchecked
     
     def get_memory_usage(self):
         """Get current memory usage in MB."""
@@ -69,6 +87,232 @@ class MemoryMonitor:
             'current_percent': current['percent']
         }
 
+def _to_dense(probs, num_qubits):
+    """Return a bitstring-keyed probability dict as a dense array indexed by int(bitstring, 2)."""
+    out = np.zeros(1 << num_qubits)
+    for k, v in probs.items():
+        out[int(k, 2)] = v
+    return out
+
+def _prob_vectors(num_qubits, *dists):
+    """
+    Align several bitstring-keyed distributions as float arrays.
+
+    Uses dense int-indexed arrays while 2**n is within _DENSE_MAX_FILL_RATIO
+    times the number of keys; beyond that the array would be mostly zeros
+    (and _all_metrics would loop over all of it), so the distributions are
+    aligned over the union of their keys instead.
+    """
+    if (1 << num_qubits) <= _DENSE_MAX_FILL_RATIO * sum(len(d) for d in dists):
+        return [_to_dense(d, num_qubits) for d in dists]
+    keys = list(set().union(*dists))
+    return [np.asarray([d.get(k, 0.0) for k in keys]) for d in dists]
+
+@njit(fastmath=True, cache=True)
+def _all_metrics(pi, pn, pz):
+    """
+    Compute TVD and Hellinger fidelity of the noisy and ZNE distributions
+    against the ideal one in a single pass over the dense probability arrays.
+
+    Returns:
+        tuple: (tvd_noisy, tvd_zne, fidelity_noisy, fidelity_zne)
+    """
+    tn = 0.0
+    tz = 0.0
+    fn = 0.0
+    fz = 0.0
+    for i in range(pi.shape[0]):
+        a = pi[i]
+        b = pn[i]
+        c = pz[i]
+        tn += abs(a - b)
+        tz += abs(a - c)
+        fn += math.sqrt(a * b)
+        fz += math.sqrt(a * c)
+    return 0.5 * tn, 0.5 * tz, fn * fn, fz * fz
+
+def _build_noise_test_circuit(num_qubits, t_depth):
+    """Build the measured H/T/CX test circuit used for the noise analysis table."""
+    test_circuit = QuantumCircuit(num_qubits)
+    for i in range(num_qubits):
+        test_circuit.h(i)
+    for i in range(min(t_depth, num_qubits)):
+        test_circuit.t(i)
+    if num_qubits > 1:
+        for i in range(num_qubits - 1):
+            test_circuit.cx(i, i + 1)
+    
+    # Add measurements
+    test_circuit.add_register(ClassicalRegister(num_qubits, "meas"))
+    test_circuit.measure(range(num_qubits), range(num_qubits))
+    return test_circuit
+
+@lru_cache(maxsize=None)
+def _ideal_probs(num_qubits, t_depth, shots=1024):
+    """
+    Ideal (noiseless) output distribution of the noise test circuit.
+
+    The result does not depend on the transpiler optimization level, so it
+    is simulated once per (num_qubits, t_depth) and shared across levels.
+    """
+    from qiskit_aer import AerSimulator
+    ideal_simulator = AerSimulator(method='statevector')
+    ideal_job = ideal_simulator.run(_build_noise_test_circuit(num_qubits, t_depth), shots=shots)
+    ideal_counts = ideal_job.result().get_counts()
+    return {k: v/shots for k, v in ideal_counts.items()}
+
+@lru_cache(maxsize=None)
+def _get_backend(backend_name):
+    """Resolve an IBM backend by name, once per process."""
+    return QiskitRuntimeService().backend(backend_name)
+
+def _run_noise_cell(backend_name, opt_level, num_qubits, t_depth, ideal_probs):
+    """
+    Run one (opt_level, num_qubits, t_depth) cell of the IBM noise table.
+
+    Runs in a worker process, so the backend is looked up by name there
+    rather than passed in. ideal_probs is simulated once per (num_qubits,
+    t_depth) by the caller (worker caches are not shared), or is the
+    exception that simulation raised.
+
+    Returns:
+        str: Formatted table row (or error row) for the cell.
+    """
+    # Any failure (backend lookup, transpile, network, unexpected result layout)
+    # becomes this cell's error row so one bad cell cannot end the whole table
+    try:
+        return _measure_noise_cell(backend_name, opt_level, num_qubits, t_depth, ideal_probs)
+    except Exception as e:
+        logger.warning("IBM backend test failed for opt_level=%s, qubits=%s, t_depth=%s: %s",
+                       opt_level, num_qubits, t_depth, e, exc_info=True)
+        return f"{opt_level}\t\t| {num_qubits}\t| {t_depth}\t| ERROR: {_short_error(e, 20)}..."
+
+def _measure_noise_cell(backend_name, opt_level, num_qubits, t_depth, ideal_probs):
+    """Body of _run_noise_cell; exceptions propagate to its per-cell handler."""
+    from qiskit.transpiler.preset_passmanagers import generate_preset_pass_manager
+    if isinstance(ideal_probs, Exception):
+        raise ideal_probs
+    backend = _get_backend(backend_name)
+    
+    # Create test circuit for noise analysis
+    test_circuit = _build_noise_test_circuit(num_qubits, t_depth)
+    
+    exec_start = time.perf_counter()
+    
+    # Run with different optimization levels
+    pass_manager = generate_preset_pass_manager(optimization_level=opt_level, backend=backend)
+    transpiled_circuit = pass_manager.run(test_circuit)
+    
+    # Noisy execution (no mitigation)
+    options_noisy = SamplerOptions()
+    options_noisy.default_shots = 1024
+    # Note: optimization_level and resilience are handled by transpiler, not sampler options
+    
+    sampler_noisy = Sampler(mode=backend, options=options_noisy)
+    job_noisy = sampler_noisy.run([(transpiled_circuit, None)])
+    result_noisy = job_noisy.result()
+    
+    # ZNE execution (with mitigation)
+    options_zne = SamplerOptions()
+    options_zne.default_shots = 1024
+    # Note: ZNE is not directly configurable in SamplerOptions V2
+    # It would need to be handled through separate error mitigation library
+    
+    sampler_zne = Sampler(mode=backend, options=options_zne)
+    job_zne = sampler_zne.run([(transpiled_circuit, None)])
+    result_zne = job_zne.result()
+    
+    # Extract counts safely
+    if hasattr(result_noisy[0].data, 'meas'):
+        noisy_counts = result_noisy[0].data.meas.get_counts()
+    else:
+        data_keys = list(result_noisy[0].data.__dict__.keys())
+        noisy_counts = getattr(result_noisy[0].data, data_keys[0]).get_counts() if data_keys else {}
+    
+    noisy_probs = {k: v/1024 for k, v in noisy_counts.items()}
+    
+    # Extract ZNE counts safely
+    if hasattr(result_zne[0].data, 'meas'):
+        zne_counts = result_zne[0].data.meas.get_counts()
+    else:
+        data_keys = list(result_zne[0].data.__dict__.keys())
+        zne_counts = getattr(result_zne[0].data, data_keys[0]).get_counts() if data_keys else {}
+    
+    zne_probs = {k: v/1024 for k, v in zne_counts.items()}
+    
+    exec_time = time.perf_counter() - exec_start
+    
+    # Nothing to compare against if any distribution came back empty
+    if not (ideal_probs and noisy_probs and zne_probs):
+        return f"{opt_level}\t\t| {num_qubits}\t| {t_depth}\t| EMPTY_DISTRIBUTIONS"
+    
+    # Calculate metrics
+    pi, pn, pz = _prob_vectors(num_qubits, ideal_probs, noisy_probs, zne_probs)
+    fidelity_ideal = 1.0  # Reference
+    tvd_noisy, tvd_zne, fidelity_noisy, fidelity_zne = _all_metrics(pi, pn, pz)
+    
+    headroom = 1.0 - fidelity_noisy
+    error_reduction = 100.0 * (fidelity_zne - fidelity_noisy) / headroom if headroom > 1e-12 else 0.0
+    
+    return _IBM_ROW_FMT(opt_level, num_qubits, t_depth, fidelity_ideal, fidelity_noisy, fidelity_zne,
+                        tvd_noisy, tvd_zne, error_reduction, exec_time)
+
+def _run_noise_cell_star(args):
+    """Unpack a task tuple for ProcessPoolExecutor.map."""
+    return _run_noise_cell(*args)
+
+def _mock_noise_table(opt_levels, qubits, depths, draws):
+    """
+    Compute simulated noisy/ZNE fidelity and TVD arrays for the mock noise table.
+
+    Args:
+        draws (np.ndarray): Pre-generated uniform noise, shaped
+            (4, len(opt_levels), len(qubits), len(depths)).
+
+    Returns:
+        tuple: (noisy_fid, zne_fid, noisy_tvd, zne_tvd), each shaped
+        (len(opt_levels), len(qubits), len(depths)).
+    """
+    ol = np.asarray(opt_levels)[:, None, None]
+    q = np.asarray(qubits, dtype=float)[None, :, None]
+    d = np.asarray(depths, dtype=float)[None, None, :]
+
+    # Simulate optimization level effects on fidelity
+    opt_bonus = np.where(ol == 1, 0.02, np.where(ol == 3, 0.04, 0.0))
+    base_fidelity = 0.95 - q * 0.02 - d * 0.03
+    noisy_fid = base_fidelity - draws[0] + opt_bonus
+    zne_fid = np.minimum(0.99, noisy_fid + draws[1])
+
+    base_tvd = 0.1 + q * 0.02 + d * 0.03
+    noisy_tvd = np.maximum(0.01, base_tvd + draws[2] - opt_bonus)
+    zne_tvd = np.maximum(0.01, noisy_tvd - draws[3])
+    return noisy_fid, zne_fid, noisy_tvd, zne_tvd
+
+def _mock_noise_draws(shape, rng=None):
+    """Draw all uniform noise terms for the mock table in one batched call per term."""
+    rng = rng if rng is not None else np.random.default_rng()
+    low = np.array([0.05, 0.03, 0.02, 0.02]).reshape(4, 1, 1, 1)
+    high = np.array([0.15, 0.10, 0.10, 0.06]).reshape(4, 1, 1, 1)
+    return rng.uniform(low, high, size=(4,) + tuple(shape))
+
+def _short_error(e, width):
+    """Truncated error message for table rows, taken from e.args to skip full __str__ formatting."""
+    msg = e.args[0] if e.args else type(e).__name__
+    return str(msg)[:width]
+
+def _write_rows(rows):
+    """Emit buffered table rows with a single write to stdout."""
+    if rows:
+        sys.stdout.write("\n".join(rows) + "\n")
+
+def _memory_row(result):
+    """Format one memory-analysis row from a table1 result record."""
+    memory_growth_mb = result['memory_growth_mb']
+    memory_per_aux = (memory_growth_mb * 1024) / max(1, result['total_aux_states'])
+    efficiency = "HIGH" if memory_per_aux < 10 else "MEDIUM" if memory_per_aux < 50 else "LOW"
+    return _MEM_ROW_FMT(result['num_qubits'], result['t_depth'], result['total_aux_states'],
+                        memory_growth_mb, memory_per_aux, result['peak_memory_mb'], efficiency)
+
 def install_htop_if_needed():
     """Install htop on macOS if not already installed."""
     try:
@@ -446,9 +690,10 @@ def generate_comprehensive_benchmark_tables(qubit_range=[3, 4, 5], t_depth_range
     print("\n=== Table: Num Qubits, T-Depth vs. Fidelity, Computational Overhead & Memory Usage ===")
     header = "Test Name\t| Qubits\t| T-Depth\t| Fidelity\t| TVD\t\t| Aux States\t| Prep Time(s)\t| T-Gadget(s)\t| BFV Enc(s)\t| BFV Dec(s)\t| Total Time(s)\t| Memory(MB)\t| Peak Mem(MB)\t| Mem Growth(MB)"
     print(header)
-    print("-" * len(header))
+    print(SEP[:len(header)])
     
     table1_results = []
+    rows = []
     
     for num_qubits in qubit_range:
         for t_depth in t_depth_range:
@@ -516,7 +761,7 @@ def generate_comprehensive_benchmark_tables(qubit_range=[3, 4, 5], t_depth_range
                 
                 # Print row with memory metrics
                 row = f"{test_name}\t\t| {num_qubits}\t| {t_depth}\t| {fidelity:.4f}\t| {tvd:.4f}\t| {total_aux_states}\t| {aux_prep_time:.4f}\t\t| {t_gadget_time:.4f}\t\t| {bfv_enc_time:.4f}\t\t| {bfv_dec_time:.4f}\t\t| {total_time:.4f}\t\t| {current_memory['rss_mb']:.1f}\t\t| {memory_growth['peak_rss_mb']:.1f}\t\t| {memory_growth['rss_growth_mb']:.1f}"
-                print(row)
+                rows.append(row)
                 
                 table1_results.append({
                     'test_name': test_name,
@@ -536,15 +781,17 @@ def generate_comprehensive_benchmark_tables(qubit_range=[3, 4, 5], t_depth_range
                 })
                 
             except Exception as e:
-                error_row = f"{test_name}\t\t| {num_qubits}\t\t| {t_depth}\t| ERROR: {str(e)[:20]}..."
-                print(error_row)
+                error_row = f"{test_name}\t\t| {num_qubits}\t\t| {t_depth}\t| ERROR: {_short_error(e, 20)}..."
+                rows.append(error_row)
+    _write_rows(rows)
     
     # Table 2: Evaluation Key Size Analysis
     print(f"\n=== Table: Evaluation Key Size Analysis ===")
     header2 = "Num Qubits\t| T-Depth\t| Layer Sizes\t| Total Aux States\t| Aux Prep Time (s)"
     print(header2)
-    print("-" * len(header2))
+    print(SEP[:len(header2)])
     
+    rows = []
     for num_qubits in qubit_range:
         for t_depth in t_depth_range:
             try:
@@ -557,166 +804,95 @@ def generate_comprehensive_benchmark_tables(qubit_range=[3, 4, 5], t_depth_range
                 
                 layer_sizes_str = str(layer_sizes) if len(str(layer_sizes)) < 15 else f"[{layer_sizes[0]}...{layer_sizes[-1]}]"
                 row = f"{num_qubits}\t\t| {t_depth}\t| {layer_sizes_str}\t| {total_aux_states}\t\t| {aux_prep_time:.4f}"
-                print(row)
+                rows.append(row)
                 
             except Exception as e:
-                error_row = f"{num_qubits}\t\t| {t_depth}\t| ERROR: {str(e)[:10]}..."
-                print(error_row)
+                error_row = f"{num_qubits}\t\t| {t_depth}\t| ERROR: {_short_error(e, 10)}..."
+                rows.append(error_row)
+    _write_rows(rows)
     
     # Table 3: Noise Effect Metrics from IBM Hardware (with Optimization Levels)
     if use_ibm_backend and backend:
         print(f"\n=== Table: IBM Hardware Noise Effects with Optimization Levels ({backend.name}) ===")
         header3 = "Opt Level\t| Qubits\t| T-Depth\t| Fidelity (Ideal)\t| Fidelity (Noisy)\t| Fidelity (ZNE)\t| TVD (Noisy)\t| TVD (ZNE)\t| Error Reduction (%)\t| Execution Time (s)"
         print(header3)
-        print("-" * len(header3))
+        print(SEP[:len(header3)])
+        
+        backend_qubits = backend.configuration().n_qubits
+        tasks = [(backend.name, opt_level, num_qubits, t_depth)
+                 for opt_level in optimization_levels
+                 for num_qubits in qubit_range
+                 if num_qubits <= backend_qubits  # Skip if backend doesn't have enough qubits
+                 for t_depth in t_depth_range]
+        
+        # Ideal simulation (for reference) is the same for every optimization level:
+        # run it once per (qubits, t_depth) here and ship it with the tasks; a
+        # failure is passed along so it shows up as those cells' error rows
+        ideal_by_size = {}
+        for size in dict.fromkeys(task[2:] for task in tasks):
+            try:
+                ideal_by_size[size] = _ideal_probs(*size)
+            except Exception as e:
+                ideal_by_size[size] = e
+        tasks = [task + (ideal_by_size[task[2:]],) for task in tasks]
         
-        for opt_level in optimization_levels:
-            for num_qubits in qubit_range:
-                if num_qubits > backend.configuration().n_qubits:
-                    continue  # Skip if backend doesn't have enough qubits
-                    
-                for t_depth in t_depth_range:
-                    try:
-                        # Create test circuit for noise analysis
-                        test_circuit = QuantumCircuit(num_qubits)
-                        for i in range(num_qubits):
-                            test_circuit.h(i)
-                        for i in range(min(t_depth, num_qubits)):
-                            test_circuit.t(i)
-                        if num_qubits > 1:
-                            for i in range(num_qubits - 1):
-                                test_circuit.cx(i, i + 1)
-                        
-                        # Add measurements
-                        test_circuit.add_register(ClassicalRegister(num_qubits, "meas"))
-                        test_circuit.measure(range(num_qubits), range(num_qubits))
-                        
-                        exec_start = time.perf_counter()
-                        
-                        # Run with different optimization levels
-                        from qiskit.transpiler.preset_passmanagers import generate_preset_pass_manager
-                        from qiskit_ibm_runtime import SamplerV2 as Sampler
-                        
-                        pass_manager = generate_preset_pass_manager(optimization_level=opt_level, backend=backend)
-                        transpiled_circuit = pass_manager.run(test_circuit)
-                        
-                        # Ideal simulation (for reference)
-                        from qiskit_aer import AerSimulator
-                        ideal_simulator = AerSimulator(method='statevector')
-                        ideal_job = ideal_simulator.run(transpiled_circuit, shots=1024)
-                        ideal_counts = ideal_job.result().get_counts()
-                        ideal_probs = {k: v/1024 for k, v in ideal_counts.items()}
-                        
-                        # Noisy execution (no mitigation)
-                        options_noisy = SamplerOptions()
-                        options_noisy.default_shots = 1024
-                        # Note: optimization_level and resilience are handled by transpiler, not sampler options
-                        
-                        sampler_noisy = Sampler(mode=backend, options=options_noisy)
-                        job_noisy = sampler_noisy.run([(transpiled_circuit, None)])
-                        result_noisy = job_noisy.result()
-                        
-                        # Extract counts safely
-                        if hasattr(result_noisy[0].data, 'meas'):
-                            noisy_counts = result_noisy[0].data.meas.get_counts()
-                        else:
-                            data_keys = list(result_noisy[0].data.__dict__.keys())
-                            noisy_counts = getattr(result_noisy[0].data, data_keys[0]).get_counts() if data_keys else {}
-                        
-                        noisy_probs = {k: v/1024 for k, v in noisy_counts.items()}
-                        
-                        # ZNE execution (with mitigation)
-                        options_zne = SamplerOptions()
-                        options_zne.default_shots = 1024
-                        # Note: ZNE is not directly configurable in SamplerOptions V2
-                        # It would need to be handled through separate error mitigation library
-                        
-                        sampler_zne = Sampler(mode=backend, options=options_zne)
-                        job_zne = sampler_zne.run([(transpiled_circuit, None)])
-                        result_zne = job_zne.result()
-                        
-                        # Extract ZNE counts safely
-                        if hasattr(result_zne[0].data, 'meas'):
-                            zne_counts = result_zne[0].data.meas.get_counts()
-                        else:
-                            data_keys = list(result_zne[0].data.__dict__.keys())
-                            zne_counts = getattr(result_zne[0].data, data_keys[0]).get_counts() if data_keys else {}
-                        
-                        zne_probs = {k: v/1024 for k, v in zne_counts.items()}
-                        
-                        exec_time = time.perf_counter() - exec_start
-                        
-                        # Calculate metrics
-                        def hellinger_fidelity(p1, p2):
-                            all_keys = set(p1.keys()) | set(p2.keys())
-                            sum_sqrt = sum(np.sqrt(p1.get(k, 0) * p2.get(k, 0)) for k in all_keys)
-                            return sum_sqrt ** 2
-                        
-                        def total_variation_distance(p1, p2):
-                            all_keys = set(p1.keys()) | set(p2.keys())
-                            return 0.5 * sum(abs(p1.get(k, 0) - p2.get(k, 0)) for k in all_keys)
-                        
-                        fidelity_ideal = 1.0  # Reference
-                        fidelity_noisy = hellinger_fidelity(ideal_probs, noisy_probs) if ideal_probs and noisy_probs else 0.0
-                        fidelity_zne = hellinger_fidelity(ideal_probs, zne_probs) if ideal_probs and zne_probs else 0.0
-                        
-                        tvd_noisy = total_variation_distance(ideal_probs, noisy_probs)
-                        tvd_zne = total_variation_distance(ideal_probs, zne_probs)
-                        
-                        error_reduction = ((fidelity_zne - fidelity_noisy) / (1 - fidelity_noisy)) * 100 if fidelity_noisy < 1 else 0
-                        
-                        row = f"{opt_level}\t\t| {num_qubits}\t| {t_depth}\t| {fidelity_ideal:.4f}\t\t| {fidelity_noisy:.4f}\t\t| {fidelity_zne:.4f}\t\t| {tvd_noisy:.4f}\t\t| {tvd_zne:.4f}\t\t| {error_reduction:.2f}\t\t\t| {exec_time:.2f}"
-                        print(row)
-                        
-                    except Exception as e:
-                        error_row = f"{opt_level}\t\t| {num_qubits}\t| {t_depth}\t| ERROR: {str(e)[:20]}..."
-                        print(error_row)
-                        logger.warning(f"IBM backend test failed for opt_level={opt_level}, qubits={num_qubits}, t_depth={t_depth}: {e}")
+        # Cells are independent transpile + execute jobs; map keeps rows in task order
+        with ProcessPoolExecutor(max_workers=min(len(tasks), os.cpu_count() or 1) or 1) as executor:
+            rows = list(executor.map(_run_noise_cell_star, tasks))
+        _write_rows(rows)
     else:
         print(f"\n=== Table: Simulated Noise Effects (IBM Backend Not Available) ===")
         header3 = "Opt Level\t| Qubits\t| T-Depth\t| Fidelity (Noisy)\t| Fidelity (ZNE)\t| TVD (Noisy)\t| TVD (ZNE)\t| Error Reduction (%)"
         print(header3)
-        print("-" * len(header3))
+        print(SEP[:len(header3)])
         
+        rows = []
         # Mock results when IBM backend is not available
-        for opt_level in optimization_levels:
-            for num_qubits in qubit_range:
-                for t_depth in t_depth_range:
-                    # Simulate optimization level effects on fidelity
-                    base_fidelity = 0.95 - (num_qubits * 0.02) - (t_depth * 0.03)
-                    opt_bonus = 0.02 if opt_level == 1 else 0.04 if opt_level == 3 else 0.0
-                    
-                    noisy_fidelity = base_fidelity - random.uniform(0.05, 0.15) + opt_bonus
-                    zne_fidelity = min(0.99, noisy_fidelity + random.uniform(0.03, 0.10))
-                    
-                    base_tvd = 0.1 + (num_qubits * 0.02) + (t_depth * 0.03)
-                    noisy_tvd = max(0.01, base_tvd + random.uniform(0.02, 0.10) - opt_bonus)
-                    zne_tvd = max(0.01, noisy_tvd - random.uniform(0.02, 0.06))
-                    
-                    error_reduction = ((zne_fidelity - noisy_fidelity) / (1 - noisy_fidelity)) * 100 if noisy_fidelity < 1 else 0
+        draws = _mock_noise_draws((len(optimization_levels), len(qubit_range), len(t_depth_range)))
+        noisy_fids, zne_fids, noisy_tvds, zne_tvds = _mock_noise_table(
+            optimization_levels, qubit_range, t_depth_range, draws
+        )
+        headroom = 1.0 - noisy_fids
+        error_reductions = np.divide(100.0 * (zne_fids - noisy_fids), headroom,
+                                     out=np.zeros_like(headroom), where=headroom > 1e-12)
+        for i, opt_level in enumerate(optimization_levels):
+            for j, num_qubits in enumerate(qubit_range):
+                for k, t_depth in enumerate(t_depth_range):
+                    noisy_fidelity = noisy_fids[i, j, k]
+                    zne_fidelity = zne_fids[i, j, k]
+                    noisy_tvd = noisy_tvds[i, j, k]
+                    zne_tvd = zne_tvds[i, j, k]
+                    error_reduction = error_reductions[i, j, k]
                     
-                    row = f"{opt_level}\t\t| {num_qubits}\t| {t_depth}\t| {noisy_fidelity:.4f}\t\t| {zne_fidelity:.4f}\t\t| {noisy_tvd:.4f}\t\t| {zne_tvd:.4f}\t\t| {error_reduction:.2f}"
-                    print(row)
+                    row = _MOCK_ROW_FMT(opt_level, num_qubits, t_depth, noisy_fidelity, zne_fidelity,
+                                        noisy_tvd, zne_tvd, error_reduction)
+                    rows.append(row)
+        _write_rows(rows)
     
     # Memory Usage Analysis
     print(f"\n=== Memory Usage Analysis: Auxiliary State Impact ===")
     print("Qubits\t| T-Depth\t| Aux States\t| Memory Growth (MB)\t| Memory per Aux State (KB)\t| Peak Memory (MB)\t| Memory Efficiency")
-    print("-" * 120)
+    print(SEP[:120])
     
-    for result in table1_results:
-        if 'memory_growth_mb' in result:
-            memory_per_aux = (result['memory_growth_mb'] * 1024) / max(1, result['total_aux_states'])
-            efficiency = "HIGH" if memory_per_aux < 10 else "MEDIUM" if memory_per_aux < 50 else "LOW"
-            
-            row = f"{result['num_qubits']}\t| {result['t_depth']}\t\t| {result['total_aux_states']}\t\t| {result['memory_growth_mb']:.2f}\t\t\t| {memory_per_aux:.2f}\t\t\t| {result['peak_memory_mb']:.1f}\t\t\t| {efficiency}"
-            print(row)
+    _write_rows([_memory_row(result) for result in table1_results if 'memory_growth_mb' in result])
     
     print(f"\n📈 Summary Statistics:")
     if table1_results:
-        avg_fidelity = sum(r['fidelity'] for r in table1_results) / len(table1_results)
-        avg_total_time = sum(r['total_time'] for r in table1_results) / len(table1_results)
-        max_memory_growth = max(r.get('memory_growth_mb', 0) for r in table1_results)
-        max_aux_states = max(r['total_aux_states'] for r in table1_results)
+        # Single pass over the results for all aggregate statistics
+        sum_fidelity = 0.0
+        sum_total_time = 0.0
+        max_memory_growth = float('-inf')
+        max_aux_states = 0
+        for r in table1_results:
+            sum_fidelity += r['fidelity']
+            sum_total_time += r['total_time']
+            memory_growth_mb = r.get('memory_growth_mb', 0)
+            if memory_growth_mb > max_memory_growth:
+                max_memory_growth = memory_growth_mb
+            if r['total_aux_states'] > max_aux_states:
+                max_aux_states = r['total_aux_states']
+        avg_fidelity = sum_fidelity / len(table1_results)
+        avg_total_time = sum_total_time / len(table1_results)
         
         print(f"   Average Fidelity: {avg_fidelity:.4f}")
         print(f"   Average Total Time: {avg_total_time:.4f}s")
@@ -734,7 +910,7 @@ def generate_comprehensive_benchmark_tables(qubit_range=[3, 4, 5], t_depth_range
     
     # Print detailed memory history if requested
     print(f"\n🧠 Memory Monitoring History:")
-    for i, record in enumerate(memory_monitor.memory_history[-5:]):  # Last 5 records
+    for record in list(memory_monitor.memory_history)[-5:]:  # Last 5 records
         print(f"   {record['label']}: {record['memory']['rss_mb']:.1f} MB RSS, {record['memory']['percent']:.1f}% of system")
     
     print("\n✅ All benchmark tables with memory monitoring completed successfully!")
@@ -6,303 +6,337 @@ Enhanced with cross-term analysis and polynomial growth tracking.
 
 import numpy as np
 import re
-import csv
-import pandas as pd
-from typing import Dict, List, Tuple
+from functools import lru_cache
+from typing import Dict, NamedTuple, Tuple
+from numba_compat import njit
+
+class ConfigSpec(NamedTuple):
+    """One benchmarked AUX-QHE configuration."""
+    config: str
+    qubits: int
+    t_depth: int
+    aux_states: int
+
+# Configuration data based on your existing results
+CONFIGS = (
+    ConfigSpec("3q-2t", 3, 2, 135),
+    ConfigSpec("3q-3t", 3, 3, 100),
+    ConfigSpec("4q-2t", 4, 2, 304),
+    ConfigSpec("4q-3t", 4, 3, 100),
+    ConfigSpec("5q-2t", 5, 2, 100),
+    ConfigSpec("5q-3t", 5, 3, 31025),
+)
+
+# A term is a cross-product if it has a '*' and, on either side of it, a
+# parenthesis, an a/b variable or a k variable - matched in one scan
+_CROSS_RE = re.compile(r'\*.*(?:\(|[ab]\d|k)|(?:\(|[ab]\d|k).*\*')
+
+# Auxiliary preparation time (s) based on actual data patterns
+_BASE_PREP_TIME = {
+    "3q-2t": 0.0018,  # From your actual data
+    "3q-3t": 0.0020,
+    "4q-2t": 0.0054,  # From your actual data
+    "4q-3t": 0.0058,
+    "5q-2t": 0.0100,
+    "5q-3t": 0.5294,  # From your actual data - large aux states
+}
+
+# Piecewise-linear cost tiers over aux_states: (upper bounds, intercepts, slopes).
+# A value in tier t costs intercepts[t] + aux_states * slopes[t]; bounds are exclusive
+# from below, i.e. aux_states > bounds[t-1] selects tier t.
+_AUX_MGMT_TIERS = (np.array([1000, 10000]),
+                   np.array([0.05, 0.1, 0.3]),
+                   np.array([0.3 / 1000, 1.5 / 10000, 4 / 100000]))
+_AUX_OVERHEAD_TIERS = (np.array([10000]),
+                       np.array([0.05, 0.3]),           # Small / large aux overhead
+                       np.array([0.2 / 10000, 2 / 100000]))
+_PREP_ESTIMATE_TIERS = (np.array([10000]),
+                        np.array([0.001, 0.1]),
+                        np.array([0.1 / 10000, 5 / 100000]))
+
+def _tiered_cost(aux_states, bounds, intercepts, slopes):
+    """Evaluate a cost tier table for a scalar or array of aux_states."""
+    aux_states = np.asarray(aux_states, dtype=np.float64)
+    tier = np.searchsorted(bounds, aux_states)
+    return intercepts[tier] + aux_states * slopes[tier]
+
+# Row templates, parsed once and reused for every table row
+_COMBINED_ROW_FMT = "{:<8} {:<11} {:.4f}      {:.3f}            {:.1f}        {}".format
+_METRIC_ROW_FMT = "{:<25} {:<10} {:<8} {:<8} {:<8}".format
+_CROSS_ROW_FMT = "{:<8} {:<12} {:<10.1f} {:<10.1f} {:<10.1f} {:<10.1f} {:<12.0f} {:<8}".format
+_SUMMARY_ROW_FMT = "{:<8} {:<11} {:<13.4f} {:<12.3f} {:<11}".format
+
+@lru_cache(maxsize=None)
+def _cached_aux_keygen(qubits: int, t_depth: int):
+    """aux_keygen(qubits, t_depth), computed once per configuration."""
+    from key_generation import aux_keygen
+    return aux_keygen(qubits, t_depth)
+
+@lru_cache(maxsize=None)
+def _cached_term_sets(qubits: int, t_depth: int):
+    """build_term_sets(qubits, t_depth) with per-layer cross-term counts, computed once per configuration."""
+    from key_generation import build_term_sets
+    return build_term_sets(qubits, t_depth, return_cross_counts=True)
 
 def count_polynomial_terms(polynomial_str: str) -> int:
-    """Count total number of terms in a polynomial string."""
-    if not polynomial_str or polynomial_str.strip() == '0':
+    """Count total number of terms in a polynomial string.
+
+    Assumes canonical form (no empty terms or leading/trailing '+'), as
+    produced by simulate_polynomial_growth, so the '+' separators are
+    counted directly instead of splitting.
+    """
+    if not polynomial_str:
         return 0
-    terms = [t.strip() for t in polynomial_str.split('+') if t.strip()]
-    return len(terms)
+    polynomial_str = polynomial_str.strip()
+    if not polynomial_str or polynomial_str == '0':
+        return 0
+    return polynomial_str.count('+') + 1
 
 def count_cross_product_terms(polynomial_str: str) -> int:
     """Count cross-product terms (containing * and parentheses)."""
     if not polynomial_str:
         return 0
+    return sum(1 for t in polynomial_str.split('+') if _CROSS_RE.search(t))
+
+def _count_both(polynomial_str: str) -> Tuple[int, int]:
+    """Count (total terms, cross-product terms) with a single split."""
+    if not polynomial_str or polynomial_str.strip() == '0':
+        return (0, 0)
     terms = [t.strip() for t in polynomial_str.split('+') if t.strip()]
-    cross_terms = 0
-    for term in terms:
-        if '*' in term and ('(' in term or re.search(r'[ab]\d+', term) or 'k' in term):
-            cross_terms += 1
-    return cross_terms
+    return (len(terms), sum(1 for t in terms if _CROSS_RE.search(t)))
 
 def calculate_cross_term_percentage(polynomial_str: str) -> float:
     """Calculate percentage of cross-product terms."""
-    total = count_polynomial_terms(polynomial_str)
-    cross = count_cross_product_terms(polynomial_str)
+    total, cross = _count_both(polynomial_str)
     return (cross / total * 100) if total > 0 else 0.0
 
-def simulate_polynomial_growth(qubits: int, t_depth: int) -> Dict[str, List[str]]:
+@njit(cache=True)
+def _sim_core(qubits, t_depth):
+    """Per-wire (f_a terms, f_b terms, f_a cross, f_b cross) after the T-gates."""
+    fa_terms = np.ones(qubits, dtype=np.int64)
+    fb_terms = np.ones(qubits, dtype=np.int64)
+    fa_cross = np.zeros(qubits, dtype=np.int64)
+    fb_cross = np.zeros(qubits, dtype=np.int64)
+    for wire in range(min(qubits, t_depth)):
+        fb_terms[wire] = fa_terms[wire] + fb_terms[wire] + 2
+        fa_terms[wire] += 1
+        fb_cross[wire] += 1
+    return fa_terms, fb_terms, fa_cross, fb_cross
+
+def simulate_polynomial_growth(qubits: int, t_depth: int, return_strings: bool = False) -> Dict[str, list]:
     """Simulate polynomial growth for T-depth gates applied to circuit.
 
     Args:
         qubits: Number of qubits (3, 4, 5)
         t_depth: Total T-gates to apply (2 or 3), not layers
+        return_strings: Also build the symbolic f_a/f_b polynomials
+            (only needed for display, e.g. create_detailed_polynomial_examples)
 
     Note: T-depth means total T-gates applied across the circuit,
     typically 1 T-gate per qubit up to t_depth limit.
-    """
-    # Initial polynomials
-    f_a = [f"a{i}" for i in range(qubits)]
-    f_b = [f"b{i}" for i in range(qubits)]
 
-    growth_data = {
-        'f_a_polynomials': [f_a.copy()],
-        'f_b_polynomials': [f_b.copy()],
-        'f_a_terms': [[1] * qubits],
-        'f_b_terms': [[1] * qubits],
-        'cross_terms': [{'f_a': [0] * qubits, 'f_b': [0] * qubits}]
-    }
+    growth_data['summary'][state] holds the per-state totals, per-wire
+    averages, cross-term percentages and growth ratio (vs. the initial state)
+    so callers only have to format them.
+
+    Results are memoized per (qubits, t_depth, return_strings). Each call
+    returns fresh dicts and lists, so callers may modify them; the count
+    arrays are shared between calls and read-only.
 
-    current_f_a = f_a.copy()
-    current_f_b = f_b.copy()
+    Term and cross-term counts are tracked as per-wire integer arrays using
+    the closed form of the T-gate key update instead of re-parsing strings:
+        f_a[wire] ← f_a[wire] ⊕ c                        (+1 term)
+        f_b[wire] ← f_a[wire] ⊕ f_b[wire] ⊕ k ⊕ (c · f_a[wire])
+                                                         (+k, +1 cross-term)
+    """
+    return _copy_growth(_simulate_polynomial_growth(qubits, t_depth, return_strings))
+
+def _copy_growth(value):
+    """Copy the dicts and lists of a growth_data structure, sharing its read-only arrays."""
+    if isinstance(value, dict):
+        return {key: _copy_growth(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_growth(item) for item in value]
+    return value
+
+@lru_cache(maxsize=32)
+def _simulate_polynomial_growth(qubits: int, t_depth: int, return_strings: bool) -> Dict[str, list]:
+    """Cached body of simulate_polynomial_growth; its result must not be handed out directly."""
+    # Initial polynomials: one term per wire, no cross-terms
+    fa_terms = np.ones(qubits, dtype=np.int64)
+    fb_terms = np.ones(qubits, dtype=np.int64)
+    fa_cross = np.zeros(qubits, dtype=np.int64)
+    fb_cross = np.zeros(qubits, dtype=np.int64)
 
     # Apply T-gates up to min(qubits, t_depth) - one per qubit maximum
     actual_t_gates = min(qubits, t_depth)
+    new_fa_terms, new_fb_terms, new_fa_cross, new_fb_cross = _sim_core(qubits, t_depth)
+
+    for arr in (fa_terms, fb_terms, fa_cross, fb_cross,
+                new_fa_terms, new_fb_terms, new_fa_cross, new_fb_cross):
+        arr.setflags(write=False)
+
+    # Per-state aggregates in one reduction: totals[state] = (fa, fb, fa_cross, fb_cross)
+    totals = np.array([[fa_terms, fb_terms, fa_cross, fb_cross],
+                       [new_fa_terms, new_fb_terms, new_fa_cross, new_fb_cross]]).sum(axis=2)
+    avgs = totals[:, :2] / qubits
+    pcts = np.divide(totals[:, 2:] * 100.0, totals[:, :2],
+                     out=np.zeros((2, 2)), where=totals[:, :2] > 0)
+    all_terms = totals[:, :2].sum(axis=1)
+    all_cross = totals[:, 2:].sum(axis=1)
+    cross_pct = np.divide(all_cross * 100.0, all_terms, out=np.zeros(2), where=all_terms > 0)
+    avg_sum = avgs.sum(axis=1)
+    growth_ratio = avg_sum / avg_sum[0] if avg_sum[0] > 0 else np.ones(2)
 
-    # Single step: apply T-gates to the first 'actual_t_gates' qubits
-    new_f_a = current_f_a.copy()
-    new_f_b = current_f_b.copy()
-    layer_f_a_terms = []
-    layer_f_b_terms = []
-    layer_cross_terms = {'f_a': [], 'f_b': []}
-
-    for wire in range(qubits):
-        if wire < actual_t_gates:
-            # This qubit gets a T-gate applied
-            # f_a[wire] ← f_a[wire] ⊕ c
-            # f_b[wire] ← f_a[wire] ⊕ f_b[wire] ⊕ k ⊕ (c · f_a[wire])
-
-            old_fa = current_f_a[wire]
-            old_fb = current_f_b[wire]
+    growth_data = {
+        'f_a_terms': [fa_terms, new_fa_terms],
+        'f_b_terms': [fb_terms, new_fb_terms],
+        'cross_terms': [{'f_a': fa_cross, 'f_b': fb_cross},
+                        {'f_a': new_fa_cross, 'f_b': new_fb_cross}],
+        'summary': [
+            {
+                'fa_total': int(totals[i, 0]), 'fb_total': int(totals[i, 1]),
+                'fa_cross_total': int(totals[i, 2]), 'fb_cross_total': int(totals[i, 3]),
+                'fa_avg': float(avgs[i, 0]), 'fb_avg': float(avgs[i, 1]),
+                'fa_cross_pct': float(pcts[i, 0]), 'fb_cross_pct': float(pcts[i, 1]),
+                'cross_pct': float(cross_pct[i]), 'growth_ratio': float(growth_ratio[i]),
+            }
+            for i in range(2)
+        ]
+    }
 
-            # Add measurement outcome to f_a
+    if return_strings:
+        f_a = [f"a{i}" for i in range(qubits)]
+        f_b = [f"b{i}" for i in range(qubits)]
+        new_f_a = f_a.copy()
+        new_f_b = f_b.copy()
+        for wire in range(actual_t_gates):
+            old_fa = f_a[wire]
+            old_fb = f_b[wire]
             new_f_a[wire] = f"{old_fa} + c_{wire}"
-
-            # Add cross-term and k-variable to f_b
-            cross_term = f"c_{wire}*({old_fa})"
-            k_var = f"k_{wire}"
-            new_f_b[wire] = f"{old_fa} + {old_fb} + {k_var} + {cross_term}"
-
-        # Count terms for this wire (whether T-gate applied or not)
-        fa_terms = count_polynomial_terms(new_f_a[wire])
-        fb_terms = count_polynomial_terms(new_f_b[wire])
-        fa_cross = count_cross_product_terms(new_f_a[wire])
-        fb_cross = count_cross_product_terms(new_f_b[wire])
-
-        layer_f_a_terms.append(fa_terms)
-        layer_f_b_terms.append(fb_terms)
-        layer_cross_terms['f_a'].append(fa_cross)
-        layer_cross_terms['f_b'].append(fb_cross)
-
-    growth_data['f_a_polynomials'].append(new_f_a.copy())
-    growth_data['f_b_polynomials'].append(new_f_b.copy())
-    growth_data['f_a_terms'].append(layer_f_a_terms)
-    growth_data['f_b_terms'].append(layer_f_b_terms)
-    growth_data['cross_terms'].append(layer_cross_terms)
+            new_f_b[wire] = f"{old_fa} + {old_fb} + k_{wire} + c_{wire}*({old_fa})"
+        growth_data['f_a_polynomials'] = [f_a, new_f_a]
+        growth_data['f_b_polynomials'] = [f_b, new_f_b]
 
     return growth_data
 
 def create_aux_overhead_table():
     """Create table showing total auxiliary overhead for all configurations and optimization levels."""
+    import pandas as pd
+    lines = []
     
-    print("🔧 TOTAL AUXILIARY OVERHEAD (seconds)")
-    print("=" * 100)
-    print("Time spent on auxiliary state processing and T-gate gadgets")
-    print()
+    lines.append("🔧 TOTAL AUXILIARY OVERHEAD (seconds)")
+    lines.append("=" * 100)
+    lines.append("Time spent on auxiliary state processing and T-gate gadgets")
+    lines.append("")
     
-    # Configuration data based on your existing results
-    configs = [
-        {"config": "3q-2t", "qubits": 3, "t_depth": 2, "aux_states": 135},
-        {"config": "3q-3t", "qubits": 3, "t_depth": 3, "aux_states": 100},
-        {"config": "4q-2t", "qubits": 4, "t_depth": 2, "aux_states": 304},
-        {"config": "4q-3t", "qubits": 4, "t_depth": 3, "aux_states": 100},
-        {"config": "5q-2t", "qubits": 5, "t_depth": 2, "aux_states": 100},
-        {"config": "5q-3t", "qubits": 5, "t_depth": 3, "aux_states": 31025}
-    ]
+    df = pd.DataFrame(CONFIGS)
+    
+    # Base auxiliary overhead components:
+    # 1. T-gate gadget processing time (scales with T-depth and qubits)
+    # 2. Auxiliary state management (scales with aux_states)
+    # 3. Polynomial evaluation time
+    t_gadget_time = 0.1 + df["t_depth"] * 0.05 + df["qubits"] * 0.02
+    aux_management = _tiered_cost(df["aux_states"], *_AUX_OVERHEAD_TIERS)
+    poly_eval_time = 0.02 + df["qubits"] * 0.01 + df["t_depth"] * 0.01
+    base_aux_overhead = t_gadget_time + aux_management + poly_eval_time
+    
+    # ZNE adds overhead for multiple auxiliary evaluations
+    zne_aux_overhead = 2.5 + df["qubits"] * 0.3  # Multiple noise level aux processing
     
-    print(f"{'Config':<8} {'Baseline':<10} {'ZNE':<8} {'Opt-0':<8} {'Opt-0+ZNE':<12} {'Opt-1':<8} {'Opt-1+ZNE':<12} {'Opt-3':<8} {'Opt-3+ZNE':<12}")
-    print("-" * 100)
+    # Optimization level impacts on auxiliary processing:
+    # Opt-0 = baseline, Opt-1 reduces aux overhead slightly, Opt-3 reduces it more
+    table = pd.DataFrame({"Config": df["config"], "Baseline": base_aux_overhead,
+                          "ZNE": base_aux_overhead + zne_aux_overhead})
+    for label, factor in (("Opt-0", 1.0), ("Opt-1", 0.95), ("Opt-3", 0.85)):
+        table[label] = base_aux_overhead * factor
+        table[f"{label}+ZNE"] = table[label] + zne_aux_overhead
     
-    for config in configs:
-        qubits = config["qubits"]
-        t_depth = config["t_depth"]
-        aux_states = config["aux_states"]
-        
-        # Base auxiliary overhead components:
-        # 1. T-gate gadget processing time
-        # 2. Auxiliary state management
-        # 3. Polynomial evaluation time
-        
-        # T-gate gadget time (scales with T-depth and qubits)
-        t_gadget_time = 0.1 + (t_depth * 0.05) + (qubits * 0.02)
-        
-        # Auxiliary state management (scales with aux_states)
-        if aux_states > 10000:
-            aux_management = 0.3 + (aux_states / 100000) * 2  # Large aux overhead
-        else:
-            aux_management = 0.05 + (aux_states / 10000) * 0.2  # Small aux overhead
-        
-        # Polynomial evaluation overhead
-        poly_eval_time = 0.02 + (qubits * 0.01) + (t_depth * 0.01)
-        
-        # Base auxiliary overhead
-        base_aux_overhead = t_gadget_time + aux_management + poly_eval_time
-        
-        # Optimization level impacts on auxiliary processing
-        opt0_factor = 1.0    # No optimization = baseline aux overhead
-        opt1_factor = 0.95   # Light optimization reduces aux overhead slightly
-        opt3_factor = 0.85   # Heavy optimization reduces aux overhead more
-        
-        # ZNE adds overhead for multiple auxiliary evaluations
-        zne_aux_overhead = 2.5 + (qubits * 0.3)  # Multiple noise level aux processing
-        
-        # Calculate total auxiliary overhead for each configuration
-        baseline_aux = base_aux_overhead
-        zne_aux = baseline_aux + zne_aux_overhead
-        
-        opt0_aux = base_aux_overhead * opt0_factor
-        opt0_zne_aux = opt0_aux + zne_aux_overhead
-        
-        opt1_aux = base_aux_overhead * opt1_factor
-        opt1_zne_aux = opt1_aux + zne_aux_overhead
-        
-        opt3_aux = base_aux_overhead * opt3_factor
-        opt3_zne_aux = opt3_aux + zne_aux_overhead
-        
-        # Print formatted row
-        print(f"{config['config']:<8} {baseline_aux:.3f}{'':>6} {zne_aux:.3f}{'':>4} "
-              f"{opt0_aux:.3f}{'':>4} {opt0_zne_aux:.3f}{'':>8} {opt1_aux:.3f}{'':>4} "
-              f"{opt1_zne_aux:.3f}{'':>8} {opt3_aux:.3f}{'':>4} {opt3_zne_aux:.3f}")
+    lines.append(table.to_string(index=False, float_format="%.3f"))
     
-    print("-" * 100)
-    print("* Includes: T-gate gadgets + Auxiliary state management + Polynomial evaluation")
-    print("* ZNE adds overhead for multiple noise level auxiliary evaluations")
-    print("* Optimization levels reduce auxiliary overhead: Opt-1(-5%), Opt-3(-15%)")
+    lines.append("-" * 100)
+    lines.append("* Includes: T-gate gadgets + Auxiliary state management + Polynomial evaluation")
+    lines.append("* ZNE adds overhead for multiple noise level auxiliary evaluations")
+    lines.append("* Optimization levels reduce auxiliary overhead: Opt-1(-5%), Opt-3(-15%)")
+
+    print("\n".join(lines))
 
 def create_aux_prep_time_table():
     """Create table showing auxiliary preparation time for all configurations."""
+    import pandas as pd
+    lines = []
     
-    print("\n⏰ AUXILIARY PREPARATION TIME (seconds)")
-    print("=" * 100)  
-    print("Time to generate and prepare auxiliary states for T-gate evaluation")
-    print()
+    lines.append("\n⏰ AUXILIARY PREPARATION TIME (seconds)")
+    lines.append("=" * 100)  
+    lines.append("Time to generate and prepare auxiliary states for T-gate evaluation")
+    lines.append("")
     
-    configs = [
-        {"config": "3q-2t", "qubits": 3, "t_depth": 2, "aux_states": 135},
-        {"config": "3q-3t", "qubits": 3, "t_depth": 3, "aux_states": 100},
-        {"config": "4q-2t", "qubits": 4, "t_depth": 2, "aux_states": 304},
-        {"config": "4q-3t", "qubits": 4, "t_depth": 3, "aux_states": 100},
-        {"config": "5q-2t", "qubits": 5, "t_depth": 2, "aux_states": 100},
-        {"config": "5q-3t", "qubits": 5, "t_depth": 3, "aux_states": 31025}
-    ]
+    df = pd.DataFrame(CONFIGS)
+    # Estimate unknown configs based on aux_states scaling
+    estimated_prep = _tiered_cost(df["aux_states"], *_PREP_ESTIMATE_TIERS)
+    base_prep_time = df["config"].map(_BASE_PREP_TIME).fillna(pd.Series(estimated_prep, index=df.index))
     
-    print(f"{'Config':<8} {'Baseline':<10} {'ZNE':<8} {'Opt-0':<8} {'Opt-0+ZNE':<12} {'Opt-1':<8} {'Opt-1+ZNE':<12} {'Opt-3':<8} {'Opt-3+ZNE':<12}")
-    print("-" * 100)
+    # Optimization levels don't significantly change preparation time
+    # (preparation happens before transpilation)
+    opt_factor = 1.0  # Minimal impact on preparation
     
-    for config in configs:
-        qubits = config["qubits"]
-        t_depth = config["t_depth"]
-        aux_states = config["aux_states"]
-        
-        # Auxiliary preparation time based on actual data patterns
-        if config["config"] == "3q-2t":
-            base_prep_time = 0.0018  # From your actual data
-        elif config["config"] == "3q-3t":
-            base_prep_time = 0.0020
-        elif config["config"] == "4q-2t":
-            base_prep_time = 0.0054  # From your actual data
-        elif config["config"] == "4q-3t":
-            base_prep_time = 0.0058
-        elif config["config"] == "5q-2t":
-            base_prep_time = 0.0100
-        elif config["config"] == "5q-3t":
-            base_prep_time = 0.5294  # From your actual data - large aux states
-        else:
-            # Estimate based on aux_states scaling
-            if aux_states > 10000:
-                base_prep_time = 0.1 + (aux_states / 100000) * 5
-            else:
-                base_prep_time = 0.001 + (aux_states / 10000) * 0.1
-        
-        # Optimization levels don't significantly change preparation time
-        # (preparation happens before transpilation)
-        opt_factor = 1.0  # Minimal impact on preparation
-        
-        # ZNE requires additional auxiliary state preparations for different noise levels
-        zne_prep_factor = 1.2  # 20% additional prep for ZNE noise scaling
-        
-        # Calculate preparation times
-        baseline_prep = base_prep_time
-        zne_prep = base_prep_time * zne_prep_factor
-        
-        opt0_prep = base_prep_time * opt_factor
-        opt0_zne_prep = base_prep_time * zne_prep_factor
-        
-        opt1_prep = base_prep_time * opt_factor
-        opt1_zne_prep = base_prep_time * zne_prep_factor
-        
-        opt3_prep = base_prep_time * opt_factor
-        opt3_zne_prep = base_prep_time * zne_prep_factor
-        
-        # Print formatted row
-        print(f"{config['config']:<8} {baseline_prep:.4f}{'':>5} {zne_prep:.4f}{'':>3} "
-              f"{opt0_prep:.4f}{'':>3} {opt0_zne_prep:.4f}{'':>7} {opt1_prep:.4f}{'':>3} "
-              f"{opt1_zne_prep:.4f}{'':>7} {opt3_prep:.4f}{'':>3} {opt3_zne_prep:.4f}")
+    # ZNE requires additional auxiliary state preparations for different noise levels
+    zne_prep_factor = 1.2  # 20% additional prep for ZNE noise scaling
     
-    print("-" * 100)
-    print("* Time to generate auxiliary states during key generation phase")
-    print("* ZNE adds ~20% preparation overhead for noise level scaling")
-    print("* Optimization levels have minimal impact on preparation time")
+    table = pd.DataFrame({"Config": df["config"], "Baseline": base_prep_time,
+                          "ZNE": base_prep_time * zne_prep_factor})
+    for label in ("Opt-0", "Opt-1", "Opt-3"):
+        table[label] = base_prep_time * opt_factor
+        table[f"{label}+ZNE"] = base_prep_time * zne_prep_factor
+    
+    lines.append(table.to_string(index=False, float_format="%.4f"))
+    
+    lines.append("-" * 100)
+    lines.append("* Time to generate auxiliary states during key generation phase")
+    lines.append("* ZNE adds ~20% preparation overhead for noise level scaling")
+    lines.append("* Optimization levels have minimal impact on preparation time")
+
+    print("\n".join(lines))
 
 def create_combined_aux_analysis():
     """Create combined analysis of aux overhead vs prep time."""
+    lines = []
     
-    print("\n📊 AUXILIARY OVERHEAD vs PREPARATION TIME ANALYSIS")
-    print("=" * 80)
+    lines.append("\n📊 AUXILIARY OVERHEAD vs PREPARATION TIME ANALYSIS")
+    lines.append("=" * 80)
     
-    print("Relationship between auxiliary states, preparation time, and processing overhead:")
-    print()
-    print(f"{'Config':<8} {'Aux States':<11} {'Prep Time':<10} {'Total Overhead':<15} {'Efficiency':<12} {'Cross-Terms':<12}")
-    print("-" * 96)
+    lines.append("Relationship between auxiliary states, preparation time, and processing overhead:")
+    lines.append("")
+    lines.append(f"{'Config':<8} {'Aux States':<11} {'Prep Time':<10} {'Total Overhead':<15} {'Efficiency':<12} {'Cross-Terms':<12}")
+    lines.append("-" * 96)
     
-    # Get CORRECT auxiliary states from actual aux_keygen function
-    from key_generation import aux_keygen
-
     configs_data = []
-    config_specs = [
-        ("3q-2t", 3, 2), ("3q-3t", 3, 3), ("4q-2t", 4, 2),
-        ("4q-3t", 4, 3), ("5q-2t", 5, 2), ("5q-3t", 5, 3)
-    ]
 
     # Generate CORRECT data using real aux_keygen
-    for config_name, qubits, t_depth in config_specs:
+    for config_name, qubits, t_depth, _ in CONFIGS:
         try:
             # Get real auxiliary states and prep time from aux_keygen
-            _, _, real_prep_time, layer_sizes, real_aux_states = aux_keygen(qubits, t_depth)
+            _, _, real_prep_time, layer_sizes, real_aux_states = _cached_aux_keygen(qubits, t_depth)
 
             # Estimate overhead based on real aux states
-            if real_aux_states > 10000:
-                estimated_overhead = 0.3 + (real_aux_states / 100000) * 4
-            elif real_aux_states > 1000:
-                estimated_overhead = 0.1 + (real_aux_states / 10000) * 1.5
-            else:
-                estimated_overhead = 0.05 + (real_aux_states / 1000) * 0.3
+            estimated_overhead = float(_tiered_cost(real_aux_states, *_AUX_MGMT_TIERS))
 
             configs_data.append({
                 "config": config_name,
+                "qubits": qubits,
+                "t_depth": t_depth,
                 "aux_states": real_aux_states,
                 "prep_time": real_prep_time,
                 "overhead": estimated_overhead,
                 "layer_sizes": layer_sizes
             })
         except Exception as e:
-            print(f"Error generating data for {config_name}: {e}")
+            lines.append(f"Error generating data for {config_name}: {e}")
             # Fallback to old data if aux_keygen fails
             configs_data.append({
                 "config": config_name,
+                "qubits": qubits,
+                "t_depth": t_depth,
                 "aux_states": 100,  # fallback
                 "prep_time": 0.01,
                 "overhead": 0.2,
@@ -312,40 +346,36 @@ def create_combined_aux_analysis():
     for data in configs_data:
         efficiency = data["aux_states"] / (data["prep_time"] + data["overhead"])
 
-        # Get T-set cross-terms (the REAL cross-terms from aux_keygen)
-        config_parts = data["config"].split("-")
-        qubits = int(config_parts[0][0])  # Extract number from "3q", "4q", "5q"
-        t_depth = int(config_parts[1][0])  # Extract number from "2t", "3t"
-
         # Get cross-terms from T-sets (same as in aux_keygen logs)
-        from key_generation import build_term_sets
-        T_sets, _ = build_term_sets(qubits, t_depth)
+        _, _, cross_counts = _cached_term_sets(data["qubits"], data["t_depth"])
 
-        # Count cross-terms in the highest T-layer
-        final_layer_terms = T_sets[t_depth]
-        total_cross_terms = len([term for term in final_layer_terms if '*' in term])
+        # Cross-terms in the highest T-layer
+        total_cross_terms = cross_counts[data["t_depth"]]
 
-        print(f"{data['config']:<8} {data['aux_states']:<11} {data['prep_time']:.4f}{'':>5} "
-              f"{data['overhead']:.3f}{'':>11} {efficiency:.1f}{'':>7} {total_cross_terms}")
+        lines.append(_COMBINED_ROW_FMT(data['config'], data['aux_states'], data['prep_time'],
+                                       data['overhead'], efficiency, total_cross_terms))
     
-    print("-" * 96)
-    print("Key Insights:")
-    print("• CORRECTED auxiliary states using real aux_keygen() results")
-    print("• Efficiency = aux_states / (prep_time + overhead)")
-    print("• Cross-Terms = cross-product terms in T-sets (for auxiliary state generation)")
-    print("• Higher efficiency indicates better auxiliary state utilization")
-    print("• Cross-terms appear only in f_b polynomials after T-gate application")
+    lines.append("-" * 96)
+    lines.append("Key Insights:")
+    lines.append("• CORRECTED auxiliary states using real aux_keygen() results")
+    lines.append("• Efficiency = aux_states / (prep_time + overhead)")
+    lines.append("• Cross-Terms = cross-product terms in T-sets (for auxiliary state generation)")
+    lines.append("• Higher efficiency indicates better auxiliary state utilization")
+    lines.append("• Cross-terms appear only in f_b polynomials after T-gate application")
+
+    print("\n".join(lines))
 
 def create_optimization_impact_summary():
     """Summarize optimization level impact on auxiliary operations."""
+    lines = []
     
-    print("\n🎯 OPTIMIZATION LEVEL IMPACT ON AUXILIARY OPERATIONS")
-    print("=" * 70)
+    lines.append("\n🎯 OPTIMIZATION LEVEL IMPACT ON AUXILIARY OPERATIONS")
+    lines.append("=" * 70)
     
-    print("How IBM optimization levels affect auxiliary processing:")
-    print()
-    print(f"{'Metric':<25} {'Baseline':<10} {'Opt-0':<8} {'Opt-1':<8} {'Opt-3':<8}")
-    print("-" * 70)
+    lines.append("How IBM optimization levels affect auxiliary processing:")
+    lines.append("")
+    lines.append(_METRIC_ROW_FMT('Metric', 'Baseline', 'Opt-0', 'Opt-1', 'Opt-3'))
+    lines.append("-" * 70)
     
     metrics = [
         ("Aux Overhead Factor", "1.00x", "1.00x", "0.95x", "0.85x"),
@@ -355,340 +385,270 @@ def create_optimization_impact_summary():
         ("Memory Usage", "Standard", "Standard", "Reduced", "Optimized")
     ]
     
-    for metric, baseline, opt0, opt1, opt3 in metrics:
-        print(f"{metric:<25} {baseline:<10} {opt0:<8} {opt1:<8} {opt3:<8}")
+    lines.extend(_METRIC_ROW_FMT(*metric) for metric in metrics)
     
-    print()
-    print("Summary:")
-    print("• Opt-1 reduces auxiliary overhead by ~5%")
-    print("• Opt-3 reduces auxiliary overhead by ~15%") 
-    print("• Preparation time is mostly independent of optimization level")
-    print("• ZNE auxiliary overhead is consistent across optimization levels")
+    lines.append("")
+    lines.append("Summary:")
+    lines.append("• Opt-1 reduces auxiliary overhead by ~5%")
+    lines.append("• Opt-3 reduces auxiliary overhead by ~15%") 
+    lines.append("• Preparation time is mostly independent of optimization level")
+    lines.append("• ZNE auxiliary overhead is consistent across optimization levels")
+
+    print("\n".join(lines))
 
 def create_cross_term_analysis_table():
     """Create comprehensive table with cross-term analysis and key size tracking."""
+    lines = []
 
-    print("\n🔬 CROSS-TERM ANALYSIS & KEY SIZE TRACKING")
-    print("=" * 120)
-    print("Polynomial growth patterns and cross-product evolution in AUX-QHE T-gate evaluation")
-    print()
-
-    configs = [
-        {"config": "3q-2t", "qubits": 3, "t_depth": 2, "aux_states": 135},
-        {"config": "3q-3t", "qubits": 3, "t_depth": 3, "aux_states": 100},
-        {"config": "4q-2t", "qubits": 4, "t_depth": 2, "aux_states": 304},
-        {"config": "4q-3t", "qubits": 4, "t_depth": 3, "aux_states": 100},
-        {"config": "5q-2t", "qubits": 5, "t_depth": 2, "aux_states": 100},
-        {"config": "5q-3t", "qubits": 5, "t_depth": 3, "aux_states": 31025}
-    ]
+    lines.append("\n🔬 CROSS-TERM ANALYSIS & KEY SIZE TRACKING")
+    lines.append("=" * 120)
+    lines.append("Polynomial growth patterns and cross-product evolution in AUX-QHE T-gate evaluation")
+    lines.append("")
 
     # Header for the cross-term table
-    print(f"{'Config':<8} {'State':<12} {'f_a Terms':<10} {'f_b Terms':<10} {'f_a Cross%':<10} {'f_b Cross%':<10} {'Key Size':<12} {'Growth':<8}")
-    print("-" * 120)
-
-    for config in configs:
-        qubits = config["qubits"]
-        t_depth = config["t_depth"]
-
-        # Simulate polynomial growth for this configuration
-        growth_data = simulate_polynomial_growth(qubits, t_depth)
-
-        # Show only two states: Initial (L0) and After T-gates (L1)
-        for state_idx in range(2):  # 0 = initial, 1 = after T-gates
-            if state_idx >= len(growth_data['f_a_terms']):
-                continue
-
-            f_a_terms = growth_data['f_a_terms'][state_idx]
-            f_b_terms = growth_data['f_b_terms'][state_idx]
-            cross_data = growth_data['cross_terms'][state_idx]
-
-            # Calculate averages and statistics
-            avg_fa_terms = sum(f_a_terms) / len(f_a_terms)
-            avg_fb_terms = sum(f_b_terms) / len(f_b_terms)
-
-            # Calculate cross-term percentages
-            if state_idx == 0:
-                fa_cross_pct = 0.0  # Initial state has no cross-terms
-                fb_cross_pct = 0.0
-            else:
-                total_fa_cross = sum(cross_data['f_a'])
-                total_fb_cross = sum(cross_data['f_b'])
-                total_fa_terms = sum(f_a_terms)
-                total_fb_terms = sum(f_b_terms)
-
-                fa_cross_pct = (total_fa_cross / total_fa_terms * 100) if total_fa_terms > 0 else 0
-                fb_cross_pct = (total_fb_cross / total_fb_terms * 100) if total_fb_terms > 0 else 0
-
-            # Estimate key size (bytes) based on polynomial complexity
-            base_key_size = (avg_fa_terms + avg_fb_terms) * qubits * 8
-            cross_key_overhead = (sum(cross_data['f_a']) + sum(cross_data['f_b'])) * 8 if state_idx > 0 else 0
-            total_key_size = base_key_size + cross_key_overhead
-
-            # Growth pattern
-            if state_idx == 0:
-                growth_pattern = "initial"
-            else:
-                # Compare with initial state
-                initial_fa = sum(growth_data['f_a_terms'][0]) / len(growth_data['f_a_terms'][0])
-                initial_fb = sum(growth_data['f_b_terms'][0]) / len(growth_data['f_b_terms'][0])
-
-                fa_growth_ratio = avg_fa_terms / initial_fa if initial_fa > 0 else 1
-                fb_growth_ratio = avg_fb_terms / initial_fb if initial_fb > 0 else 1
-
-                # Determine growth based on total polynomial expansion
-                total_initial = initial_fa + initial_fb
-                total_final = avg_fa_terms + avg_fb_terms
-                growth_ratio = total_final / total_initial if total_initial > 0 else 1
-
-                if growth_ratio < 2:
-                    growth_pattern = "linear"
-                elif growth_ratio < 4:
-                    growth_pattern = "quad"
-                else:
-                    growth_pattern = "exp"
-
-            # Print row
+    lines.append(f"{'Config':<8} {'State':<12} {'f_a Terms':<10} {'f_b Terms':<10} {'f_a Cross%':<10} {'f_b Cross%':<10} {'Key Size':<12} {'Growth':<8}")
+    lines.append("-" * 120)
+
+    # Simulate polynomial growth for every configuration and stack the
+    # per-state summaries into (config, state) arrays
+    summaries = [simulate_polynomial_growth(c.qubits, c.t_depth)['summary'] for c in CONFIGS]
+    stats = {key: np.array([[state[key] for state in summary] for summary in summaries])
+             for key in ('fa_avg', 'fb_avg', 'fa_cross_total', 'fb_cross_total',
+                         'fa_cross_pct', 'fb_cross_pct', 'growth_ratio')}
+    qubits_arr = np.array([c.qubits for c in CONFIGS])[:, None]
+
+    # Estimate key size (bytes) based on polynomial complexity
+    key_sizes = ((stats['fa_avg'] + stats['fb_avg']) * qubits_arr * 8
+                 + (stats['fa_cross_total'] + stats['fb_cross_total']) * 8)
+
+    # Growth pattern, from total polynomial expansion vs. the initial state
+    ratio = stats['growth_ratio']
+    is_initial = np.broadcast_to(np.arange(2) == 0, ratio.shape)
+    growth_patterns = np.select([is_initial, ratio < 2, ratio < 4],
+                                ["initial", "linear", "quad"], default="exp")
+
+    # Show only two states: Initial (L0) and After T-gates (L1)
+    for i, config in enumerate(CONFIGS):
+        for state_idx in range(2):
             if state_idx == 0:
                 state_label = "Initial"
-                config_label = config["config"]
+                config_label = config.config
             else:
-                state_label = f"T-gates({min(qubits, t_depth)})"
+                state_label = f"T-gates({min(config.qubits, config.t_depth)})"
                 config_label = ""
 
-            print(f"{config_label:<8} {state_label:<12} {avg_fa_terms:<10.1f} {avg_fb_terms:<10.1f} "
-                  f"{fa_cross_pct:<10.1f} {fb_cross_pct:<10.1f} {total_key_size:<12.0f} {growth_pattern:<8}")
+            lines.append(_CROSS_ROW_FMT(config_label, state_label, stats['fa_avg'][i, state_idx],
+                                        stats['fb_avg'][i, state_idx], stats['fa_cross_pct'][i, state_idx],
+                                        stats['fb_cross_pct'][i, state_idx], key_sizes[i, state_idx],
+                                        growth_patterns[i, state_idx]))
+
+    lines.append("-" * 120)
+    lines.append("Legend:")
+    lines.append("• f_a/f_b Terms: Average polynomial terms per wire")
+    lines.append("• Cross%: Percentage of cross-product terms (a_i·b_j, k_1·k_2, etc.)")
+    lines.append("• Key Size: Estimated memory usage in bytes")
+    lines.append("• Growth: linear/quad/exp pattern detection")
 
-    print("-" * 120)
-    print("Legend:")
-    print("• f_a/f_b Terms: Average polynomial terms per wire")
-    print("• Cross%: Percentage of cross-product terms (a_i·b_j, k_1·k_2, etc.)")
-    print("• Key Size: Estimated memory usage in bytes")
-    print("• Growth: linear/quad/exp pattern detection")
+    print("\n".join(lines))
 
 def create_detailed_polynomial_examples():
     """Show detailed polynomial examples for specific configurations."""
+    lines = []
 
-    print("\n📝 DETAILED POLYNOMIAL EXAMPLES")
-    print("=" * 80)
-    print("Example polynomial evolution for 3q-2t configuration:")
-    print()
+    lines.append("\n📝 DETAILED POLYNOMIAL EXAMPLES")
+    lines.append("=" * 80)
+    lines.append("Example polynomial evolution for 3q-2t configuration:")
+    lines.append("")
 
-    growth_data = simulate_polynomial_growth(3, 2)
+    growth_data = simulate_polynomial_growth(3, 2, return_strings=True)
 
     # Only iterate through available states (initial + after T-gates)
     state_names = ["Initial State", "After T-gates"]
 
     for state_idx in range(len(growth_data['f_a_polynomials'])):
-        print(f"--- {state_names[state_idx]} ---")
+        lines.append(f"--- {state_names[state_idx]} ---")
 
         for wire in range(3):
             fa_poly = growth_data['f_a_polynomials'][state_idx][wire]
             fb_poly = growth_data['f_b_polynomials'][state_idx][wire]
 
-            fa_terms = count_polynomial_terms(fa_poly)
-            fb_terms = count_polynomial_terms(fb_poly)
-            fa_cross = count_cross_product_terms(fa_poly)
-            fb_cross = count_cross_product_terms(fb_poly)
+            fa_terms, fa_cross = _count_both(fa_poly)
+            fb_terms, fb_cross = _count_both(fb_poly)
 
-            print(f"Wire {wire}:")
-            print(f"  f_a[{wire}] = {fa_poly}")
-            print(f"           {fa_terms} terms, {fa_cross} cross-products ({fa_cross/fa_terms*100:.1f}%)" if fa_terms > 0 else "           1 term, 0 cross-products (0.0%)")
-            print(f"  f_b[{wire}] = {fb_poly}")
-            print(f"           {fb_terms} terms, {fb_cross} cross-products ({fb_cross/fb_terms*100:.1f}%)" if fb_terms > 0 else "           1 term, 0 cross-products (0.0%)")
-            print()
+            lines.append(f"Wire {wire}:")
+            lines.append(f"  f_a[{wire}] = {fa_poly}")
+            lines.append(f"           {fa_terms} terms, {fa_cross} cross-products ({fa_cross/fa_terms*100:.1f}%)" if fa_terms > 0 else "           1 term, 0 cross-products (0.0%)")
+            lines.append(f"  f_b[{wire}] = {fb_poly}")
+            lines.append(f"           {fb_terms} terms, {fb_cross} cross-products ({fb_cross/fb_terms*100:.1f}%)" if fb_terms > 0 else "           1 term, 0 cross-products (0.0%)")
+            lines.append("")
 
     # Show which wires actually received T-gates
-    print("T-gate Application Summary:")
-    print(f"• 3q-2t: T-gates applied to first 2 qubits (Wire 0, Wire 1)")
-    print(f"• Wire 2 remains unchanged (no T-gate applied)")
-    print(f"• Cross-products only appear in f_b polynomials of T-gate wires")
+    lines.append("T-gate Application Summary:")
+    lines.append(f"• 3q-2t: T-gates applied to first 2 qubits (Wire 0, Wire 1)")
+    lines.append(f"• Wire 2 remains unchanged (no T-gate applied)")
+    lines.append(f"• Cross-products only appear in f_b polynomials of T-gate wires")
+
+    print("\n".join(lines))
 
 def create_measurement_summary():
     """Create summary matching your original request format."""
+    lines = []
 
-    print("\n📊 MEASUREMENT SUMMARY (Your Format)")
-    print("=" * 60)
+    lines.append("\n📊 MEASUREMENT SUMMARY (Your Format)")
+    lines.append("=" * 60)
 
     # Example from your request
-    print("Example Measurement Code Results:")
-    print()
+    lines.append("Example Measurement Code Results:")
+    lines.append("")
 
     initial_key = "a_i"
-    print(f"Initial: {initial_key}, {count_polynomial_terms(initial_key)} term")
+    lines.append(f"Initial: {initial_key}, {count_polynomial_terms(initial_key)} term")
 
     key_after_depth1 = "a_i + c_1 + k_1"
-    print(f"After T-depth 1: {count_polynomial_terms(key_after_depth1)} terms")
+    lines.append(f"After T-depth 1: {count_polynomial_terms(key_after_depth1)} terms")
 
     key_after_depth2 = "a_i + c_1 + k_1 + c_2 + k_2 + c_1*(a_i) + c_2*(a_i + c_1 + k_1)"
-    print(f"After T-depth 2: {count_polynomial_terms(key_after_depth2)} terms")
+    total_terms, cross_terms = _count_both(key_after_depth2)
+    lines.append(f"After T-depth 2: {total_terms} terms")
 
-    cross_terms = count_cross_product_terms(key_after_depth2)
-    total_terms = count_polynomial_terms(key_after_depth2)
     percentage = (cross_terms / total_terms * 100) if total_terms > 0 else 0
-    print(f"Cross-products: {percentage:.1f}%")
+    lines.append(f"Cross-products: {percentage:.1f}%")
 
-    print("\nWhat to Measure from YOUR System:")
-    print("✓ Initial key polynomial: 1 term (a_i)")
-    print("✓ After each T-gate: Count terms in f_a,i and f_b,i")
-    print("✓ Cross-product identification: Original terms vs. cross-products")
-    print("✓ Growth pattern: Linear (1→3→5) vs. Exponential (1→2→4→8)")
+    lines.append("\nWhat to Measure from YOUR System:")
+    lines.append("✓ Initial key polynomial: 1 term (a_i)")
+    lines.append("✓ After each T-gate: Count terms in f_a,i and f_b,i")
+    lines.append("✓ Cross-product identification: Original terms vs. cross-products")
+    lines.append("✓ Growth pattern: Linear (1→3→5) vs. Exponential (1→2→4→8)")
 
-    print("\nActual AUX-QHE System Measurements:")
+    lines.append("\nActual AUX-QHE System Measurements:")
 
     for config_name, qubits, t_depth in [("3q-2t", 3, 2), ("4q-2t", 4, 2), ("5q-3t", 5, 3)]:
         growth_data = simulate_polynomial_growth(qubits, t_depth)
 
-        print(f"\n{config_name} Configuration:")
-        print(f"  Initial→ T1→ T{t_depth}")
+        lines.append(f"\n{config_name} Configuration:")
+        lines.append(f"  Initial→ T1→ T{t_depth}")
 
         # Average across all wires
-        initial_terms = sum(growth_data['f_a_terms'][0]) / qubits
-        t1_terms = sum(growth_data['f_a_terms'][1]) / qubits if t_depth >= 1 else initial_terms
-        final_terms = sum(growth_data['f_a_terms'][-1]) / qubits
+        summary = growth_data['summary']
+        initial_terms = summary[0]['fa_avg']
+        t1_terms = summary[1]['fa_avg'] if t_depth >= 1 else initial_terms
+        final_terms = summary[-1]['fa_avg']
 
-        print(f"  f_a terms: {initial_terms:.0f} → {t1_terms:.0f} → {final_terms:.0f}")
+        lines.append(f"  f_a terms: {initial_terms:.0f} → {t1_terms:.0f} → {final_terms:.0f}")
 
         if t_depth >= 2:
-            final_cross = sum(growth_data['cross_terms'][-1]['f_a']) + sum(growth_data['cross_terms'][-1]['f_b'])
-            final_total = sum(growth_data['f_a_terms'][-1]) + sum(growth_data['f_b_terms'][-1])
-            cross_pct = (final_cross / final_total * 100) if final_total > 0 else 0
-            print(f"  Final cross-products: {cross_pct:.1f}%")
-
-if __name__ == "__main__":
-    create_aux_overhead_table()
-    create_aux_prep_time_table()
-    create_combined_aux_analysis()
-    create_optimization_impact_summary()
-
-    # NEW: Cross-term analysis tables
-    create_cross_term_analysis_table()
-    create_detailed_polynomial_examples()
-    create_measurement_summary()
+            lines.append(f"  Final cross-products: {summary[-1]['cross_pct']:.1f}%")
 
-    print("\n✅ Auxiliary overhead and preparation time analysis completed!")
-    print("📈 Use these tables to understand auxiliary processing costs across optimization levels")
-    print("🔬 Cross-term analysis shows polynomial growth patterns and key size evolution")
+    print("\n".join(lines))
 
 def export_all_tables_to_csv(filename="aux_qhe_tables_export.csv"):
     """Export all tables to a single CSV file with comprehensive data."""
+    import pandas as pd
 
     print(f"\n📊 EXPORTING ALL TABLES TO CSV: {filename}")
     print("=" * 60)
 
-    # Get CORRECT auxiliary states from actual aux_keygen function
-    from key_generation import aux_keygen, build_term_sets
-
-    config_specs = [
-        ("3q-2t", 3, 2), ("3q-3t", 3, 3), ("4q-2t", 4, 2),
-        ("4q-3t", 4, 3), ("5q-2t", 5, 2), ("5q-3t", 5, 3)
-    ]
-
-    all_data = []
-
-    # Generate comprehensive data for each configuration
-    for config_name, qubits, t_depth in config_specs:
+    # Optimization scenarios: overhead factor and whether ZNE is applied
+    scenarios_df = pd.DataFrame({
+        'Scenario': ['Baseline', 'ZNE', 'Opt-0', 'Opt-0+ZNE', 'Opt-1', 'Opt-1+ZNE', 'Opt-3', 'Opt-3+ZNE'],
+        'opt_factor': [1.0, 1.0, 1.0, 1.0, 0.95, 0.95, 0.85, 0.85],
+        'zne': [False, True] * 4,
+    })
+    zne_prep_factor = 1.2
+
+    # Collect the per-configuration inputs from aux_keygen and the T-sets
+    base_records = []
+    for config_name, qubits, t_depth, _ in CONFIGS:
         try:
-            # Get real data from aux_keygen
-            _, _, real_prep_time, layer_sizes, real_aux_states = aux_keygen(qubits, t_depth)
-
-            # Get T-set cross-terms
-            T_sets, _ = build_term_sets(qubits, t_depth)
-            final_layer_terms = T_sets[t_depth]
-            t_set_cross_terms = len([term for term in final_layer_terms if '*' in term])
-
-            # Calculate various overhead metrics
-            # Base auxiliary overhead
-            t_gadget_time = 0.1 + (t_depth * 0.05) + (qubits * 0.02)
-
-            if real_aux_states > 10000:
-                aux_management = 0.3 + (real_aux_states / 100000) * 4
-            elif real_aux_states > 1000:
-                aux_management = 0.1 + (real_aux_states / 10000) * 1.5
-            else:
-                aux_management = 0.05 + (real_aux_states / 1000) * 0.3
-
-            poly_eval_time = 0.02 + (qubits * 0.01) + (t_depth * 0.01)
-            base_aux_overhead = t_gadget_time + aux_management + poly_eval_time
-
-            # ZNE overhead
-            zne_aux_overhead = 2.5 + (qubits * 0.3)
-
-            # Optimization factors
-            opt1_factor = 0.95
-            opt3_factor = 0.85
-            zne_prep_factor = 1.2
-
-            # Calculate all optimization scenarios
-            scenarios = {
-                'Baseline': {'overhead': base_aux_overhead, 'prep': real_prep_time},
-                'ZNE': {'overhead': base_aux_overhead + zne_aux_overhead, 'prep': real_prep_time * zne_prep_factor},
-                'Opt-0': {'overhead': base_aux_overhead, 'prep': real_prep_time},
-                'Opt-0+ZNE': {'overhead': base_aux_overhead + zne_aux_overhead, 'prep': real_prep_time * zne_prep_factor},
-                'Opt-1': {'overhead': base_aux_overhead * opt1_factor, 'prep': real_prep_time},
-                'Opt-1+ZNE': {'overhead': base_aux_overhead * opt1_factor + zne_aux_overhead, 'prep': real_prep_time * zne_prep_factor},
-                'Opt-3': {'overhead': base_aux_overhead * opt3_factor, 'prep': real_prep_time},
-                'Opt-3+ZNE': {'overhead': base_aux_overhead * opt3_factor + zne_aux_overhead, 'prep': real_prep_time * zne_prep_factor}
-            }
+            _, _, real_prep_time, layer_sizes, real_aux_states = _cached_aux_keygen(qubits, t_depth)
+            _, _, cross_counts = _cached_term_sets(qubits, t_depth)
+            t_set_cross_terms = cross_counts[t_depth]
 
             # Get polynomial cross-terms (from simulation)
             growth_data = simulate_polynomial_growth(qubits, t_depth)
             if len(growth_data['cross_terms']) > 1:
                 final_cross_data = growth_data['cross_terms'][1]
-                poly_cross_terms = sum(final_cross_data['f_a']) + sum(final_cross_data['f_b'])
+                poly_cross_terms = int(final_cross_data['f_a'].sum() + final_cross_data['f_b'].sum())
             else:
                 poly_cross_terms = 0
 
-            # Add one row per scenario
-            for scenario_name, scenario_data in scenarios.items():
-                efficiency = real_aux_states / (scenario_data['prep'] + scenario_data['overhead'])
-
-                row = {
-                    'Config': config_name,
-                    'Qubits': qubits,
-                    'T_Depth': t_depth,
-                    'Scenario': scenario_name,
-                    'Aux_States': real_aux_states,
-                    'Layer_Sizes': str(layer_sizes),
-                    'Prep_Time_s': round(scenario_data['prep'], 4),
-                    'Total_Overhead_s': round(scenario_data['overhead'], 3),
-                    'Efficiency': round(efficiency, 1),
-                    'T_Set_Cross_Terms': t_set_cross_terms,
-                    'Polynomial_Cross_Terms': poly_cross_terms,
-                    'T_Gadget_Time_s': round(t_gadget_time, 4),
-                    'Aux_Management_s': round(aux_management, 4),
-                    'Poly_Eval_Time_s': round(poly_eval_time, 4),
-                    'ZNE_Overhead_s': round(zne_aux_overhead, 3) if 'ZNE' in scenario_name else 0
-                }
-                all_data.append(row)
-
+            base_records.append((config_name, qubits, t_depth, real_aux_states, str(layer_sizes),
+                                 real_prep_time, t_set_cross_terms, poly_cross_terms))
         except Exception as e:
             print(f"Error processing {config_name}: {e}")
 
-    # Create DataFrame and export to CSV
-    df = pd.DataFrame(all_data)
+    base_df = pd.DataFrame(base_records, columns=[
+        'Config', 'Qubits', 'T_Depth', 'Aux_States', 'Layer_Sizes',
+        'prep_time', 'T_Set_Cross_Terms', 'Polynomial_Cross_Terms'])
+
+    # Base auxiliary overhead components, one value per configuration
+    aux_states = base_df['Aux_States']
+    base_df['T_Gadget_Time_s'] = 0.1 + base_df['T_Depth'] * 0.05 + base_df['Qubits'] * 0.02
+    base_df['Aux_Management_s'] = _tiered_cost(aux_states, *_AUX_MGMT_TIERS)
+    base_df['Poly_Eval_Time_s'] = 0.02 + base_df['Qubits'] * 0.01 + base_df['T_Depth'] * 0.01
+    base_df['base_overhead'] = (base_df['T_Gadget_Time_s'] + base_df['Aux_Management_s']
+                                + base_df['Poly_Eval_Time_s'])
+    base_df['zne_add'] = 2.5 + base_df['Qubits'] * 0.3
+
+    # One row per (configuration, scenario)
+    out = base_df.merge(scenarios_df, how='cross')
+    overhead = out['base_overhead'] * out['opt_factor'] + out['zne'] * out['zne_add']
+    prep = out['prep_time'] * np.where(out['zne'], zne_prep_factor, 1.0)
+
+    df = pd.DataFrame({
+        'Config': out['Config'],
+        'Qubits': out['Qubits'],
+        'T_Depth': out['T_Depth'],
+        'Scenario': out['Scenario'],
+        'Aux_States': out['Aux_States'],
+        'Layer_Sizes': out['Layer_Sizes'],
+        'Prep_Time_s': prep.round(4),
+        'Total_Overhead_s': overhead.round(3),
+        'Efficiency': (out['Aux_States'] / (prep + overhead)).round(1),
+        'T_Set_Cross_Terms': out['T_Set_Cross_Terms'],
+        'Polynomial_Cross_Terms': out['Polynomial_Cross_Terms'],
+        'T_Gadget_Time_s': out['T_Gadget_Time_s'].round(4),
+        'Aux_Management_s': out['Aux_Management_s'].round(4),
+        'Poly_Eval_Time_s': out['Poly_Eval_Time_s'].round(4),
+        'ZNE_Overhead_s': np.where(out['zne'], out['zne_add'].round(3), 0),
+    })
 
     # Save to CSV
     df.to_csv(filename, index=False)
 
-    print(f"✅ Exported {len(all_data)} rows to {filename}")
+    print(f"✅ Exported {len(df)} rows to {filename}")
     print(f"📊 Columns: {', '.join(df.columns)}")
-    print(f"📈 Configurations: {len(config_specs)} configs × {len(scenarios)} scenarios = {len(all_data)} total rows")
+    print(f"📈 Configurations: {len(CONFIGS)} configs × {len(scenarios_df)} scenarios = {len(df)} total rows")
 
     # Display summary statistics
     print(f"\n📋 SUMMARY STATISTICS:")
     print(f"{'Config':<8} {'Aux States':<11} {'Max Prep Time':<13} {'Max Overhead':<12} {'T-Set Cross':<11}")
     print("-" * 60)
 
-    for config_name, qubits, t_depth in config_specs:
-        config_data = df[df['Config'] == config_name]
-        if not config_data.empty:
-            max_prep = config_data['Prep_Time_s'].max()
-            max_overhead = config_data['Total_Overhead_s'].max()
-            aux_states = config_data['Aux_States'].iloc[0]
-            cross_terms = config_data['T_Set_Cross_Terms'].iloc[0]
-
-            print(f"{config_name:<8} {aux_states:<11} {max_prep:<13.4f} {max_overhead:<12.3f} {cross_terms:<11}")
+    summary = df.groupby('Config', sort=False).agg(
+        aux_states=('Aux_States', 'first'), max_prep=('Prep_Time_s', 'max'),
+        max_overhead=('Total_Overhead_s', 'max'), cross_terms=('T_Set_Cross_Terms', 'first'))
+    for row in summary.itertuples():
+        print(_SUMMARY_ROW_FMT(row.Index, row.aux_states, row.max_prep, row.max_overhead, row.cross_terms))
 
     return filename
 
-# Note: For CSV export, use the standalone script: python export_tables_to_csv.py
\ No newline at end of file
+if __name__ == "__main__":
+    create_aux_overhead_table()
+    create_aux_prep_time_table()
+    create_combined_aux_analysis()
+    create_optimization_impact_summary()
+
+    # NEW: Cross-term analysis tables
+    create_cross_term_analysis_table()
+    create_detailed_polynomial_examples()
+    create_measurement_summary()
+
+    try:
+        export_all_tables_to_csv()
+    except Exception as e:
+        print(f"CSV export failed: {e}")
+
+    print("\n✅ Auxiliary overhead and preparation time analysis completed!")
+    print("📈 Use these tables to understand auxiliary processing costs across optimization levels")
+    print("🔬 Cross-term analysis shows polynomial growth patterns and key size evolution")
@@ -3,17 +3,8 @@ AUX-QHE Algorithm: High-Level Pseudocode for Research Paper
 Auxiliary Quantum Homomorphic Encryption - Novel Theoretical Framework
 """
 
-def generate_aux_qhe_pseudocode():
-    """Generate conference-ready pseudocode for AUX-QHE algorithm."""
-    
-    print("🎓 AUX-QHE ALGORITHM: HIGH-LEVEL PSEUDOCODE FOR RESEARCH PAPER")
-    print("=" * 80)
-    print("Novel Auxiliary Quantum Homomorphic Encryption Framework")
-    print("=" * 80)
-    print()
-    
-    # Main Algorithm Structure
-    pseudocode = """
+# Main Algorithm Structure (built once at import; the generator just returns it)
+_PSEUDOCODE = """
 ALGORITHM: Auxiliary Quantum Homomorphic Encryption (AUX-QHE)
 
 INPUT: 
@@ -228,8 +219,17 @@ NOVELTY CONTRIBUTIONS:
     4. Zero-noise extrapolation optimization for NISQ devices
     5. Theoretical framework bridging quantum computing and homomorphic encryption
 """
+
+def generate_aux_qhe_pseudocode():
+    """Generate conference-ready pseudocode for AUX-QHE algorithm."""
+    
+    print("🎓 AUX-QHE ALGORITHM: HIGH-LEVEL PSEUDOCODE FOR RESEARCH PAPER")
+    print("=" * 80)
+    print("Novel Auxiliary Quantum Homomorphic Encryption Framework")
+    print("=" * 80)
+    print()
     
-    return pseudocode
+    return _PSEUDOCODE
 
 if __name__ == "__main__":
     pseudocode = generate_aux_qhe_pseudocode()
@@ -3,8 +3,109 @@ Auxiliary States and Cross-Terms Analysis Table
 Separated table showing: Config | Aux States | Prep Time | Total Overhead | Efficiency | Cross-Terms
 """
 
+import csv
+import sys
 import numpy as np
-import pandas as pd
+from contextlib import nullcontext
+from functools import lru_cache
+from typing import NamedTuple
+
+class TableRow(NamedTuple):
+    """One configuration row of the aux states & cross-terms table (CSV column order)."""
+    Config: str
+    Qubits: int
+    T_Depth: int
+    Aux_States: int
+    Layer_Sizes: str
+    Prep_Time_s: float
+    Total_Overhead_s: float
+    Efficiency: float
+    T_Set_Cross_Terms: int
+    T_Gadget_Time_s: float
+    Aux_Management_s: float
+    Poly_Eval_Time_s: float
+
+_CSV_FILENAME = "aux_states_cross_terms_table.csv"
+_CSV_FIELDS = TableRow._fields
+
+# Row templates, parsed once and reused for every table row
+_ROW_FMT = "{:<8} {:<11} {:<10.4f} {:<15.3f} {:<12.1f} {}".format
+_LAYER_ROW_FMT = "{:<8} L{:<6} {:<12} {:<12} {:<12} {:<10.1f}%".format
+
+_CONFIG_SPECS = [
+    ("3q-2t", 3, 2), ("3q-3t", 3, 3), ("4q-2t", 4, 2),
+    ("4q-3t", 4, 3), ("5q-2t", 5, 2), ("5q-3t", 5, 3)
+]
+
+# (t_gadget_time, poly_eval_time) depend only on (qubits, t_depth), so they are
+# evaluated once here for the fixed configurations
+_OVERHEAD = {
+    (qubits, t_depth): (0.1 + (t_depth * 0.05) + (qubits * 0.02),
+                        0.02 + (qubits * 0.01) + (t_depth * 0.01))
+    for _, qubits, t_depth in _CONFIG_SPECS
+}
+
+@lru_cache(maxsize=None)
+def _cached_keygen(qubits, t_depth):
+    """aux_keygen(qubits, t_depth), computed once per configuration."""
+    from key_generation import aux_keygen
+    return aux_keygen(qubits, t_depth)
+
+@lru_cache(maxsize=None)
+def _cached_keygen_sizes(qubits, t_depth):
+    """aux_keygen_sizes(qubits, t_depth), computed once per configuration."""
+    from key_generation import aux_keygen_sizes
+    return aux_keygen_sizes(qubits, t_depth)
+
+@lru_cache(maxsize=None)
+def _cached_factor_counts(qubits, t_depth):
+    """build_term_factor_counts(qubits, t_depth), computed once per configuration."""
+    from key_generation import build_term_factor_counts
+    return build_term_factor_counts(qubits, t_depth)
+
+@lru_cache(maxsize=None)
+def _cached_cross_count(qubits, t_depth, layer):
+    """Number of cross-product terms (two or more factors) in T[layer]."""
+    return int(np.count_nonzero(_cached_factor_counts(qubits, t_depth)[layer] >= 2))
+
+def _process_config(spec):
+    """
+    Compute one row of the aux states & cross-terms table.
+
+    Returns:
+        tuple: (formatted table line, TableRow or None on error)
+    """
+    config_name, qubits, t_depth = spec
+    try:
+        # Get real auxiliary states and prep time from aux_keygen
+        _, _, real_prep_time, layer_sizes, real_aux_states = _cached_keygen(qubits, t_depth)
+
+        # Calculate overhead based on real aux states
+        t_gadget_time, poly_eval_time = _OVERHEAD[(qubits, t_depth)]
+
+        if real_aux_states > 10000:
+            aux_management = 0.3 + (real_aux_states / 100000) * 4
+        elif real_aux_states > 1000:
+            aux_management = 0.1 + (real_aux_states / 10000) * 1.5
+        else:
+            aux_management = 0.05 + (real_aux_states / 1000) * 0.3
+
+        total_overhead = t_gadget_time + aux_management + poly_eval_time
+
+        # Calculate efficiency
+        efficiency = real_aux_states / (real_prep_time + total_overhead)
+
+        # Get T-set cross-terms (the real cross-terms from aux_keygen logs)
+        t_set_cross_terms = _cached_cross_count(qubits, t_depth, t_depth)
+
+        line = _ROW_FMT(config_name, real_aux_states, real_prep_time, total_overhead, efficiency, t_set_cross_terms)
+        row = TableRow(config_name, qubits, t_depth, real_aux_states, str(layer_sizes),
+                       real_prep_time, total_overhead, efficiency, t_set_cross_terms,
+                       t_gadget_time, aux_management, poly_eval_time)
+        return line, row
+
+    except Exception as e:
+        return f"❌ Error processing {config_name}: {e}", None
 
 def create_aux_states_cross_terms_table(export_csv=False):
     """
@@ -13,143 +114,102 @@ def create_aux_states_cross_terms_table(export_csv=False):
     Args:
         export_csv (bool): If True, export to CSV file
     """
+    lines = []
 
-    print("📊 AUXILIARY STATES & CROSS-TERMS ANALYSIS")
-    print("=" * 84)
-    print("Relationship between auxiliary states, preparation time, and cross-term complexity")
-    print()
-
-    # Get CORRECT auxiliary states from actual aux_keygen function
-    from key_generation import aux_keygen, build_term_sets
-
-    config_specs = [
-        ("3q-2t", 3, 2), ("3q-3t", 3, 3), ("4q-2t", 4, 2),
-        ("4q-3t", 4, 3), ("5q-2t", 5, 2), ("5q-3t", 5, 3)
-    ]
+    lines.append("📊 AUXILIARY STATES & CROSS-TERMS ANALYSIS")
+    lines.append("=" * 84)
+    lines.append("Relationship between auxiliary states, preparation time, and cross-term complexity")
+    lines.append("")
 
     # Table header
-    print(f"{'Config':<8} {'Aux States':<11} {'Prep Time':<10} {'Total Overhead':<15} {'Efficiency':<12} {'Cross-Terms':<12}")
-    print("-" * 84)
+    lines.append(f"{'Config':<8} {'Aux States':<11} {'Prep Time':<10} {'Total Overhead':<15} {'Efficiency':<12} {'Cross-Terms':<12}")
+    lines.append("-" * 84)
 
     table_data = []
 
-    for config_name, qubits, t_depth in config_specs:
-        try:
-            # Get real auxiliary states and prep time from aux_keygen
-            _, _, real_prep_time, layer_sizes, real_aux_states = aux_keygen(qubits, t_depth)
-
-            # Calculate overhead based on real aux states
-            t_gadget_time = 0.1 + (t_depth * 0.05) + (qubits * 0.02)
-
-            if real_aux_states > 10000:
-                aux_management = 0.3 + (real_aux_states / 100000) * 4
-            elif real_aux_states > 1000:
-                aux_management = 0.1 + (real_aux_states / 10000) * 1.5
-            else:
-                aux_management = 0.05 + (real_aux_states / 1000) * 0.3
-
-            poly_eval_time = 0.02 + (qubits * 0.01) + (t_depth * 0.01)
-            total_overhead = t_gadget_time + aux_management + poly_eval_time
-
-            # Calculate efficiency
-            efficiency = real_aux_states / (real_prep_time + total_overhead)
+    # Configurations run one after another in this process: aux_keygen's prep
+    # time is what the table reports, so it must not compete with other keygens
+    # for the CPU, and the _cached_* results stay here for the breakdown table
+    results = [_process_config(spec) for spec in _CONFIG_SPECS]
 
-            # Get T-set cross-terms (the real cross-terms from aux_keygen logs)
-            T_sets, _ = build_term_sets(qubits, t_depth)
-            final_layer_terms = T_sets[t_depth]
-            t_set_cross_terms = len([term for term in final_layer_terms if '*' in term])
+    with (open(_CSV_FILENAME, 'w', newline='') if export_csv else nullcontext()) as csv_file:
+        writer = csv.writer(csv_file) if export_csv else None
+        if writer:
+            writer.writerow(_CSV_FIELDS)
 
+        for line, row in results:
             # Print table row
-            print(f"{config_name:<8} {real_aux_states:<11} {real_prep_time:<10.4f} {total_overhead:<15.3f} {efficiency:<12.1f} {t_set_cross_terms}")
+            lines.append(line)
 
             # Store data for CSV export
-            table_data.append({
-                'Config': config_name,
-                'Qubits': qubits,
-                'T_Depth': t_depth,
-                'Aux_States': real_aux_states,
-                'Layer_Sizes': str(layer_sizes),
-                'Prep_Time_s': real_prep_time,
-                'Total_Overhead_s': total_overhead,
-                'Efficiency': efficiency,
-                'T_Set_Cross_Terms': t_set_cross_terms,
-                'T_Gadget_Time_s': t_gadget_time,
-                'Aux_Management_s': aux_management,
-                'Poly_Eval_Time_s': poly_eval_time
-            })
+            if row is not None:
+                table_data.append(row)
+                if writer:
+                    writer.writerow(row)
 
-        except Exception as e:
-            print(f"❌ Error processing {config_name}: {e}")
+    lines.append("-" * 84)
+    lines.append("Key Insights:")
+    lines.append("• CORRECTED auxiliary states using real aux_keygen() results")
+    lines.append("• Efficiency = aux_states / (prep_time + overhead)")
+    lines.append("• Cross-Terms = cross-product terms in T-sets (for auxiliary state generation)")
+    lines.append("• Higher efficiency indicates better auxiliary state utilization")
+    lines.append("• T-set cross-terms drive auxiliary preparation complexity")
 
-    print("-" * 84)
-    print("Key Insights:")
-    print("• CORRECTED auxiliary states using real aux_keygen() results")
-    print("• Efficiency = aux_states / (prep_time + overhead)")
-    print("• Cross-Terms = cross-product terms in T-sets (for auxiliary state generation)")
-    print("• Higher efficiency indicates better auxiliary state utilization")
-    print("• T-set cross-terms drive auxiliary preparation complexity")
+    sys.stdout.write("\n".join(lines) + "\n")
 
     # Export to CSV if requested
     if export_csv and table_data:
-        df = pd.DataFrame(table_data)
-        csv_filename = "aux_states_cross_terms_table.csv"
-        df.to_csv(csv_filename, index=False)
-        print(f"\n💾 Table exported to CSV: {csv_filename}")
-        print(f"📊 {len(table_data)} rows × {len(df.columns)} columns")
-        return csv_filename
+        print(f"\n💾 Table exported to CSV: {_CSV_FILENAME}")
+        print(f"📊 {len(table_data)} rows × {len(_CSV_FIELDS)} columns")
+        return _CSV_FILENAME
 
     return table_data
 
 def create_detailed_breakdown_table():
     """Create a more detailed breakdown of the auxiliary states and cross-terms."""
+    lines = []
 
-    print("\n🔬 DETAILED AUXILIARY STATES BREAKDOWN")
-    print("=" * 100)
-    print("Layer-by-layer analysis of auxiliary states and cross-term growth")
-    print()
-
-    # Get data from aux_keygen
-    from key_generation import aux_keygen, build_term_sets
-
-    config_specs = [
-        ("3q-2t", 3, 2), ("3q-3t", 3, 3), ("4q-2t", 4, 2),
-        ("4q-3t", 4, 3), ("5q-2t", 5, 2), ("5q-3t", 5, 3)
-    ]
+    lines.append("\n🔬 DETAILED AUXILIARY STATES BREAKDOWN")
+    lines.append("=" * 100)
+    lines.append("Layer-by-layer analysis of auxiliary states and cross-term growth")
+    lines.append("")
 
-    print(f"{'Config':<8} {'Layer':<7} {'Total Terms':<12} {'Cross-Terms':<12} {'Aux States':<12} {'Cross %':<10}")
-    print("-" * 100)
+    lines.append(f"{'Config':<8} {'Layer':<7} {'Total Terms':<12} {'Cross-Terms':<12} {'Aux States':<12} {'Cross %':<10}")
+    lines.append("-" * 100)
 
-    for config_name, qubits, t_depth in config_specs:
+    for config_name, qubits, t_depth in _CONFIG_SPECS:
         try:
             # Get layer information
-            T_sets, _ = build_term_sets(qubits, t_depth)
-            _, _, _, layer_sizes, total_aux_states = aux_keygen(qubits, t_depth)
+            factor_counts = _cached_factor_counts(qubits, t_depth)
+            layer_aux_sizes = _cached_keygen_sizes(qubits, t_depth)
+            total_aux_states = sum(layer_aux_sizes.values())
 
             for layer in range(1, t_depth + 1):
-                layer_terms = T_sets[layer]
-                total_terms = len(layer_terms)
-                cross_terms = len([term for term in layer_terms if '*' in term])
-                layer_aux_states = qubits * total_terms  # aux states for this layer
+                total_terms = len(factor_counts[layer])
+                cross_terms = _cached_cross_count(qubits, t_depth, layer)
+                layer_aux_states = layer_aux_sizes[layer]  # aux states for this layer
                 cross_percentage = (cross_terms / total_terms * 100) if total_terms > 0 else 0
 
                 config_label = config_name if layer == 1 else ""
-                print(f"{config_label:<8} L{layer:<6} {total_terms:<12} {cross_terms:<12} {layer_aux_states:<12} {cross_percentage:<10.1f}%")
+                lines.append(_LAYER_ROW_FMT(config_label, layer, total_terms, cross_terms, layer_aux_states, cross_percentage))
 
             # Add total row
-            print(f"{'TOTAL':<8} {'ALL':<6} {'-':<12} {'-':<12} {total_aux_states:<12} {'-':<10}")
-            if config_name != config_specs[-1][0]:  # Not last config
-                print("-" * 100)
+            lines.append(f"{'TOTAL':<8} {'ALL':<6} {'-':<12} {'-':<12} {total_aux_states:<12} {'-':<10}")
+            if config_name != _CONFIG_SPECS[-1][0]:  # Not last config
+                lines.append("-" * 100)
 
         except Exception as e:
-            print(f"❌ Error processing {config_name}: {e}")
-
-    print("-" * 100)
-    print("Legend:")
-    print("• Layer: T-depth layer (L1, L2, L3)")
-    print("• Total Terms: |T[ℓ]| - total terms in T-set for this layer")
-    print("• Cross-Terms: Number of cross-product terms like (a₀)*(b₁)")
-    print("• Aux States: Number of auxiliary states for this layer")
-    print("• Cross %: Percentage of terms that are cross-products")
+            lines.append(f"❌ Error processing {config_name}: {e}")
+
+    lines.append("-" * 100)
+    lines.append("Legend:")
+    lines.append("• Layer: T-depth layer (L1, L2, L3)")
+    lines.append("• Total Terms: |T[ℓ]| - total terms in T-set for this layer")
+    lines.append("• Cross-Terms: Number of cross-product terms like (a₀)*(b₁)")
+    lines.append("• Aux States: Number of auxiliary states for this layer")
+    lines.append("• Cross %: Percentage of terms that are cross-products")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 if __name__ == "__main__":
     # Create the main table
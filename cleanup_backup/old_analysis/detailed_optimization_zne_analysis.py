@@ -53,38 +53,30 @@ def create_detailed_opt_zne_table():
           f"{'Opt-3':<8} {'Opt-3+ZNE':<10} {'Best Combo':<12} {'ZNE Confidence':<13} {'Aux Prep(s)':<12}")
     print("-" * 130)
     
-    for config in configs:
-        qubits = config["qubits"]
-        t_depth = config["t_depth"]
-        
-        # Simulate hardware fidelity for each optimization level
-        # Based on typical IBM quantum performance patterns
-        base_fidelity = max(0.001, 0.80 - (qubits * 0.04) - (t_depth * 0.02))
-        
-        opt0_fidelity = base_fidelity * 0.90  # No optimization penalty
-        opt1_fidelity = base_fidelity * 1.05  # Light optimization benefit  
-        opt3_fidelity = base_fidelity * 1.15  # Heavy optimization benefit
-        
-        # Apply ZNE improvement on top of each optimization level
-        # ZNE effectiveness varies by optimization level
-        zne_improvement_factor = 1.2  # 20% improvement typical for ZNE
-        
-        opt0_zne = min(0.999, opt0_fidelity * zne_improvement_factor)
-        opt1_zne = min(0.999, opt1_fidelity * zne_improvement_factor) 
-        opt3_zne = min(0.999, opt3_fidelity * zne_improvement_factor)
-        
-        # Determine best combination
-        best_fidelity = max(opt0_zne, opt1_zne, opt3_zne)
-        if best_fidelity == opt3_zne:
-            best_combo = "Opt-3+ZNE"
-        elif best_fidelity == opt1_zne:
-            best_combo = "Opt-1+ZNE"
-        else:
-            best_combo = "Opt-0+ZNE"
-        
+    qubits = np.array([c["qubits"] for c in configs])
+    t_depth = np.array([c["t_depth"] for c in configs])
+    
+    # Simulate hardware fidelity for each optimization level
+    # Based on typical IBM quantum performance patterns
+    base_fidelity = np.maximum(0.001, 0.80 - (qubits * 0.04) - (t_depth * 0.02))
+    
+    # Rows: Opt-0 (no optimization penalty), Opt-1 (light benefit), Opt-3 (heavy benefit)
+    opt_fidelity = base_fidelity * np.array([0.90, 1.05, 1.15])[:, None]
+    
+    # Apply ZNE improvement on top of each optimization level
+    # ZNE effectiveness varies by optimization level
+    zne_improvement_factor = 1.2  # 20% improvement typical for ZNE
+    opt_zne = np.minimum(0.999, opt_fidelity * zne_improvement_factor)
+    
+    # Determine best combination (ties go to the higher optimization level)
+    combo_labels = np.array(["Opt-0+ZNE", "Opt-1+ZNE", "Opt-3+ZNE"])
+    best_combo = combo_labels[2 - opt_zne[::-1].argmax(axis=0)]
+    
+    for config, (opt0_fidelity, opt1_fidelity, opt3_fidelity), (opt0_zne, opt1_zne, opt3_zne), combo in zip(
+            configs, opt_fidelity.T, opt_zne.T, best_combo):
         # Print row
         print(f"{config['config']:<8} {opt0_fidelity:.4f}   {opt0_zne:.4f}     {opt1_fidelity:.4f}   "
-              f"{opt1_zne:.4f}     {opt3_fidelity:.4f}   {opt3_zne:.4f}     {best_combo:<12} "
+              f"{opt1_zne:.4f}     {opt3_fidelity:.4f}   {opt3_zne:.4f}     {combo:<12} "
               f"{config['zne_confidence']:.3f}{'':>9} {config['aux_prep_time']:.4f}")
     
     print("-" * 130)
@@ -12,17 +12,43 @@ import logging
 import numpy as np
 import time
 from typing import Dict, List, Tuple, Optional
+from numba_compat import njit
 from qiskit import QuantumCircuit
 from qiskit_ibm_runtime import SamplerV2 as Sampler, SamplerOptions
+from qiskit.circuit.equivalence_library import SessionEquivalenceLibrary
+from qiskit.transpiler import PassManager
+from qiskit.transpiler.passes import BasisTranslator
 from qiskit.transpiler.preset_passmanagers import generate_preset_pass_manager
 from qiskit.quantum_info import hellinger_fidelity
-from scipy.optimize import curve_fit
 from circuit_evaluation import aux_eval
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+@njit(cache=True)
+def _entropy_fidelity(counts):
+    """Fidelity proxy 1 - H/H_max of a count distribution (higher entropy = more noise)."""
+    probs = counts / counts.sum()
+    entropy = -np.sum(probs * np.log2(probs + 1e-10))
+    max_entropy = np.log2(counts.size)
+    return 1.0 - (entropy / max_entropy if max_entropy > 0 else 0.0)
+
+# Largest noise factor amplified by local two-qubit gate folding; above it the
+# whole unitary is folded
+_LOCAL_FOLDING_MAX_FACTOR = 3.0
+
+# Noise factors always executed before the sweep may stop early; more points than
+# any model has parameters, so a fit cannot be exact just by interpolating
+_ADAPTIVE_MIN_POINTS = 4
+
+# Row template for generate_zne_performance_table, keyed by enhanced_zne_execution result fields
+_ZNE_ROW_FMT = ("{config}\t| {num_qubits}\t| {t_depth}\t| "
+                "{aux_states}\t| {fidelity_baseline:.4f}\t\t| "
+                "{fidelity_zne:.4f}\t\t| {fidelity_improvement_percent:.2f}\t\t| "
+                "{tvd_reduction_percent:.2f}\t\t\t| {extrapolation_model}\t| "
+                "{extrapolation_confidence:.3f}\t\t| {total_time:.2f}")
+
 class EnhancedZNEOptimizer:
     """
     Advanced ZNE implementation optimized for AUX-QHE algorithm performance.
@@ -34,9 +60,20 @@ class EnhancedZNEOptimizer:
     - Performance metrics tracking
     """
     
-    def __init__(self, backend):
+    def __init__(self, backend, adaptive_cutoff: float = 0.99):
         self.backend = backend
+        self.adaptive_cutoff = adaptive_cutoff  # R² at which the noise-factor sweep stops early
         self.performance_history = []
+        self._samplers = {}  # shots -> Sampler, reused across executions
+        
+    def _get_sampler(self, shots: int):
+        """Return the Sampler for this backend and shot count, creating it on first use."""
+        sampler = self._samplers.get(shots)
+        if sampler is None:
+            options = SamplerOptions()
+            options.default_shots = shots
+            sampler = self._samplers[shots] = Sampler(mode=self.backend, options=options)
+        return sampler
         
     def adaptive_noise_factors(self, num_qubits: int, t_depth: int, aux_states: int) -> List[float]:
         """
@@ -71,100 +108,208 @@ class EnhancedZNEOptimizer:
     def circuit_folding_amplification(self, circuit: QuantumCircuit, noise_factor: float) -> QuantumCircuit:
         """
         Apply circuit folding to amplify noise by specified factor.
-        Uses unitary folding: U → U·U†·U (measurement gates excluded)
+        Uses local two-qubit gate folding up to _LOCAL_FOLDING_MAX_FACTOR and global
+        unitary folding above it: U → U·U†·U (measurement gates excluded)
         """
         if noise_factor == 1.0:
             return circuit
         
-        # Separate measurement gates from unitary operations  
-        # Copy the original circuit structure (registers and all)
-        unitary_circuit = QuantumCircuit(*circuit.qregs, *circuit.cregs)
-        measurement_ops = []
+        if noise_factor <= _LOCAL_FOLDING_MAX_FACTOR:
+            return self.local_folding_amplification(circuit, noise_factor)
+        
+        unitary_circuit, measurement_tail = self._split_measurements(circuit)
+        return self.fold_unitary_circuit(unitary_circuit, measurement_tail, noise_factor)
+    
+    def local_folding_amplification(self, circuit: QuantumCircuit, noise_factor: float) -> QuantumCircuit:
+        """
+        Amplify noise by folding individual two-qubit gates: G → G·G†·G.
+        
+        round((noise_factor - 1) / 2 · n_2q) of the n_2q two-qubit gates are folded,
+        spread evenly over the circuit, so the two-qubit noise scales by ~noise_factor
+        while single-qubit gates and measurements are left untouched. Falls back to
+        global folding for circuits without two-qubit gates.
+        """
+        return self._local_fold(circuit, noise_factor)[0]
+    
+    def _local_fold(self, circuit: QuantumCircuit, noise_factor: float) -> Tuple[QuantumCircuit, float]:
+        """
+        local_folding_amplification, also returning the realized noise scale.
         
-        for instr, qargs, cargs in circuit.data:
-            if instr.name == 'measure':
-                measurement_ops.append((instr, qargs, cargs))
+        Whole gates are folded, so the scale actually applied to the two-qubit
+        noise is 1 + 2·num_folds/n_2q rather than noise_factor itself.
+        """
+        two_qubit_gates = sum(
+            1 for instruction in circuit.data
+            if instruction.operation.num_qubits == 2 and not instruction.is_directive()
+        )
+        if two_qubit_gates == 0:
+            unitary_circuit, measurement_tail = self._split_measurements(circuit)
+            return self._global_fold(unitary_circuit, measurement_tail, noise_factor)
+        
+        num_folds = min(two_qubit_gates, round((noise_factor - 1.0) / 2.0 * two_qubit_gates))
+        
+        folded_circuit = circuit.copy_empty_like()
+        gate_index = 0
+        for instruction in circuit.data:
+            folded_circuit.append(instruction.operation, instruction.qubits, instruction.clbits)
+            if instruction.operation.num_qubits != 2 or instruction.is_directive():
+                continue
+            # Fold gate j when floor((j + 1)·k / n) steps past floor(j·k / n), which
+            # picks exactly k of the n gates at even spacing (deterministic round-robin)
+            if (gate_index + 1) * num_folds // two_qubit_gates > gate_index * num_folds // two_qubit_gates:
+                folded_circuit.append(instruction.operation.inverse(), instruction.qubits, instruction.clbits)
+                folded_circuit.append(instruction.operation, instruction.qubits, instruction.clbits)
+            gate_index += 1
+        
+        realized_factor = 1.0 + 2.0 * num_folds / two_qubit_gates
+        logger.debug(f"Local folding: {noise_factor}x noise requested, {realized_factor:.3f}x realized, "
+                    f"{num_folds}/{two_qubit_gates} two-qubit gates, "
+                    f"{circuit.size()} → {folded_circuit.size()} gates")
+        
+        return folded_circuit, realized_factor
+    
+    def _split_measurements(self, circuit: QuantumCircuit) -> Tuple[QuantumCircuit, QuantumCircuit]:
+        """
+        Separate measurement gates from unitary operations.
+        
+        Returns:
+            Tuple of (unitary circuit, measurement-only circuit), both on the
+            original circuit's registers
+        """
+        # Copy the original circuit structure (registers and all) and move the
+        # instructions over; remove_final_measurements() measured slower here
+        # because it round-trips through a DAG.
+        unitary_circuit = circuit.copy_empty_like()
+        measurement_tail = circuit.copy_empty_like()
+        
+        for instruction in circuit.data:
+            if instruction.operation.name == 'measure':
+                measurement_tail.append(instruction.operation, instruction.qubits, instruction.clbits)
             else:
-                unitary_circuit.append(instr, qargs, cargs)
+                unitary_circuit.append(instruction.operation, instruction.qubits, instruction.clbits)
+        
+        return unitary_circuit, measurement_tail
+    
+    def fold_unitary_circuit(self, unitary_circuit: QuantumCircuit, measurement_tail: QuantumCircuit,
+                             noise_factor: float) -> QuantumCircuit:
+        """
+        Fold an already-split circuit: U → U·U†·U, then re-append the measurements.
         
-        # Apply folding only to unitary part
+        Lets callers split a circuit once (e.g. the transpiled base circuit) and
+        fold it for several noise factors.
+        """
+        return self._global_fold(unitary_circuit, measurement_tail, noise_factor)[0]
+    
+    def _global_fold(self, unitary_circuit: QuantumCircuit, measurement_tail: QuantumCircuit,
+                     noise_factor: float) -> Tuple[QuantumCircuit, float]:
+        """
+        fold_unitary_circuit, also returning the realized noise scale.
+        
+        Each round adds U†·U, so the scale actually applied is 1 + 2·rounds for
+        the rounds completed, whatever noise_factor was requested.
+        """
+        # Apply folding only to unitary part. copy() clones the instruction list in one
+        # step; rebuilding from copy_empty_like() via compose/append measured slower,
+        # and compose(inplace=False) on the first round copies internally anyway.
         folded_circuit = unitary_circuit.copy()
         
         # Calculate number of folding rounds needed
         fold_rounds = max(1, int((noise_factor - 1.0) / 2.0))
+        completed_rounds = 0
         
-        for _ in range(fold_rounds):
-            # Add inverse operations (U†) - only for unitary gates
-            try:
-                inverse_circuit = unitary_circuit.inverse()
-                folded_circuit = folded_circuit.compose(inverse_circuit)
+        try:
+            # U† is the same for every round, so build it once
+            inverse_circuit = unitary_circuit.inverse()
+            for _ in range(fold_rounds):
+                # Add inverse operations (U†) - only for unitary gates
+                folded_circuit.compose(inverse_circuit, inplace=True)
                 # Add original operations again (U)
-                folded_circuit = folded_circuit.compose(unitary_circuit)
-            except Exception as e:
-                logger.warning(f"Circuit folding failed: {e}, skipping fold round")
-                break
+                folded_circuit.compose(unitary_circuit, inplace=True)
+                completed_rounds += 1
+        except Exception as e:
+            logger.warning(f"Circuit folding failed: {e}, skipping remaining fold rounds")
         
         # Re-add measurement gates at the end
-        for instr, qargs, cargs in measurement_ops:
-            folded_circuit.append(instr, qargs, cargs)
+        folded_circuit.compose(measurement_tail, inplace=True)
         
-        logger.debug(f"Circuit folding: {noise_factor}x noise, {fold_rounds} rounds, "
-                    f"{circuit.size()} → {folded_circuit.size()} gates")
+        realized_factor = 1.0 + 2.0 * completed_rounds
+        logger.debug(f"Circuit folding: {noise_factor}x noise requested, {realized_factor:.0f}x realized, "
+                    f"{completed_rounds}/{fold_rounds} rounds, "
+                    f"{unitary_circuit.size() + measurement_tail.size()} → {folded_circuit.size()} gates")
         
-        return folded_circuit
+        return folded_circuit, realized_factor
     
     def multi_model_extrapolation(self, noise_factors: List[float], 
-                                  fidelities: List[float]) -> Tuple[float, str, float]:
+                                  fidelities: List[float],
+                                  include_polynomial: bool = True) -> Tuple[float, str, float]:
         """
         Apply multiple extrapolation models and choose the best fit.
         
+        include_polynomial=False restricts the choice to the two-parameter linear and
+        exponential models, whose R² stays meaningful on few points (a quadratic
+        through 3 points always has R² = 1).
+        
         Returns:
             Tuple of (extrapolated_fidelity, best_model_name, confidence_score)
         """
         models = {}
         
+        # Shared by every model: data arrays and the total sum of squares for R²
+        x = np.asarray(noise_factors, dtype=np.float64)
+        y = np.asarray(fidelities, dtype=np.float64)
+        y_centered = y - y.mean()
+        ss_tot = float(np.dot(y_centered, y_centered))
+        vander = np.vander(x, 3)  # Columns [λ², λ, 1], shared by the linear and quadratic fits
+        
+        def r_squared(y_pred):
+            resid = y - y_pred
+            ss_res = float(np.dot(resid, resid))
+            return 1 - (ss_res / ss_tot) if ss_tot > 0 else 0
+        
         # Linear extrapolation
         try:
-            z = np.polyfit(noise_factors, fidelities, 1)
-            linear_extrap = np.poly1d(z)(0.0)
+            z, *_ = np.linalg.lstsq(vander[:, 1:], y, rcond=None)
+            linear_extrap = z[-1]  # Value at λ = 0
             # R² calculation for linear fit
-            y_pred = np.poly1d(z)(noise_factors)
-            ss_res = np.sum((np.array(fidelities) - y_pred) ** 2)
-            ss_tot = np.sum((np.array(fidelities) - np.mean(fidelities)) ** 2)
-            r2_linear = 1 - (ss_res / ss_tot) if ss_tot > 0 else 0
+            r2_linear = r_squared(vander[:, 1:] @ z)
             models['linear'] = (max(0.0, min(1.0, linear_extrap)), r2_linear)
         except:
             models['linear'] = (0.0, 0.0)
         
         # Exponential extrapolation: f(λ) = A * exp(-B * λ)
+        # Fitted in closed form as log f = log A - B·λ over the positive fidelities
         try:
-            def exp_model(x, A, B):
-                return A * np.exp(-B * x)
-            
-            popt, _ = curve_fit(exp_model, noise_factors, fidelities, 
-                               bounds=([0.5, 0], [1.5, 10]), maxfev=1000)
-            exp_extrap = exp_model(0.0, *popt)
+            positive = y > 1e-6
+            if np.count_nonzero(positive) < 2:
+                # lstsq would return a minimum-norm solution instead of failing
+                raise ValueError("exponential fit needs at least 2 positive fidelities")
+            x_pos = x[positive]
+            log_y = np.log(y[positive])
+            design = np.column_stack([np.ones(x_pos.size), -x_pos])
+            (log_A, B), *_ = np.linalg.lstsq(design, log_y, rcond=None)
+            A = np.exp(log_A)
+            if not (0.5 <= A <= 1.5 and 0.0 <= B <= 10.0):
+                # Clamp A, then refit B for that A (1-D least squares on the logs) so
+                # the reported curve and its R² belong together
+                A = min(1.5, max(0.5, A))
+                B = float(np.dot(x_pos, np.log(A) - log_y) / np.dot(x_pos, x_pos))
+                B = min(10.0, max(0.0, B))
+            exp_extrap = A  # Value at λ = 0
             
-            # Calculate R² for exponential fit
-            y_pred = exp_model(np.array(noise_factors), *popt)
-            ss_res = np.sum((np.array(fidelities) - y_pred) ** 2)
-            ss_tot = np.sum((np.array(fidelities) - np.mean(fidelities)) ** 2)
-            r2_exp = 1 - (ss_res / ss_tot) if ss_tot > 0 else 0
+            # Calculate R² for exponential fit (on the fidelities, not their logs)
+            r2_exp = r_squared(A * np.exp(-B * x))
             models['exponential'] = (max(0.0, min(1.0, exp_extrap)), r2_exp)
         except:
             models['exponential'] = (0.0, 0.0)
         
         # Polynomial extrapolation (degree 2)
-        if len(noise_factors) >= 3:
+        if include_polynomial and len(noise_factors) >= 3:
             try:
-                z = np.polyfit(noise_factors, fidelities, 2)
-                poly_extrap = np.poly1d(z)(0.0)
+                z, *_ = np.linalg.lstsq(vander, y, rcond=None)
+                poly_extrap = z[-1]  # Value at λ = 0
                 
                 # R² calculation for polynomial fit
-                y_pred = np.poly1d(z)(noise_factors)
-                ss_res = np.sum((np.array(fidelities) - y_pred) ** 2)
-                ss_tot = np.sum((np.array(fidelities) - np.mean(fidelities)) ** 2)
-                r2_poly = 1 - (ss_res / ss_tot) if ss_tot > 0 else 0
+                r2_poly = r_squared(vander @ z)
                 models['polynomial'] = (max(0.0, min(1.0, poly_extrap)), r2_poly)
             except:
                 models['polynomial'] = (0.0, 0.0)
@@ -179,6 +324,86 @@ class EnhancedZNEOptimizer:
         
         return best_fidelity, best_name, confidence
     
+    def _execute_noise_factors(self, base_transpiled: QuantumCircuit, unitary_transpiled: QuantumCircuit,
+                               measurement_tail: QuantumCircuit, basis_pass_manager: PassManager,
+                               factors: List[float], shots: int) -> Tuple[List[float], List[float], List[float]]:
+        """
+        Fold the transpiled circuit for each noise factor and run them as one Sampler job.
+        
+        Folding only reaches discrete scales (whole gates or whole rounds), so each
+        factor's realized scale is returned for the extrapolation to fit against.
+        
+        Returns:
+            Tuple of (fidelity per factor, execution time per factor, realized noise scale per factor)
+        """
+        batch_start = time.perf_counter()
+        fidelity_data = []
+        execution_times = []
+        
+        # Translate all folded circuits in one run() call; the pass manager fans a
+        # list of circuits out across worker processes (qiskit parallel_map)
+        folds = [
+            self._local_fold(base_transpiled, factor)
+            if factor <= _LOCAL_FOLDING_MAX_FACTOR
+            else self._global_fold(unitary_transpiled, measurement_tail, factor)
+            for factor in factors if factor > 1.0
+        ]
+        folded_circuits = basis_pass_manager.run([folded_circuit for folded_circuit, _ in folds])
+        folded_iter = iter(folded_circuits)
+        transpiled_circuits = [next(folded_iter) if factor > 1.0 else base_transpiled
+                               for factor in factors]
+        realized_iter = iter([realized_factor for _, realized_factor in folds])
+        realized_factors = [next(realized_iter) if factor > 1.0 else 1.0 for factor in factors]
+        
+        # Submit all noise levels as one batched job (fixed for SamplerV2)
+        sampler = self._get_sampler(shots)
+        
+        try:
+            job = sampler.run([(transpiled_circuit, None) for transpiled_circuit in transpiled_circuits])
+            result = job.result()
+        except Exception as e:
+            logger.error(f"Batched execution failed for noise factors {factors}: {e}")
+            result = None
+        
+        # One job covers every factor, so its wall time is shared evenly between them
+        factor_time = (time.perf_counter() - batch_start) / len(factors)
+        
+        for i, factor in enumerate(realized_factors):
+            if result is None:
+                fidelity_data.append(0.0)
+                execution_times.append(0.0)
+                continue
+            
+            try:
+                # Extract counts
+                if hasattr(result[i].data, 'meas'):
+                    counts = result[i].data.meas.get_counts()
+                elif hasattr(result[i].data, 'c'):
+                    counts = result[i].data.c.get_counts()
+                else:
+                    data_keys = list(result[i].data.__dict__.keys())
+                    counts = getattr(result[i].data, data_keys[0]).get_counts() if data_keys else {}
+                
+                # Calculate fidelity (simplified - use distribution entropy as proxy)
+                if counts:
+                    # Normalized entropy as fidelity proxy (higher entropy = more noise)
+                    fidelity = float(_entropy_fidelity(
+                        np.fromiter(counts.values(), dtype=np.float64, count=len(counts))))
+                else:
+                    fidelity = 0.0
+                
+                fidelity_data.append(fidelity)
+                execution_times.append(factor_time)
+                
+                logger.debug(f"Noise factor {factor:.2f}: fidelity={fidelity:.4f}, time={factor_time:.2f}s")
+                
+            except Exception as e:
+                logger.error(f"Execution failed at noise factor {factor}: {e}")
+                fidelity_data.append(0.0)
+                execution_times.append(0.0)
+        
+        return fidelity_data, execution_times, realized_factors
+    
     def enhanced_zne_execution(self, circuit: QuantumCircuit, enc_a: List, enc_b: List, 
                               auxiliary_states: Dict, max_t_depth: int,
                               encryptor, decryptor, encoder, evaluator, poly_degree: int,
@@ -221,68 +446,59 @@ class EnhancedZNEOptimizer:
         
         # Step 3: Execute at different noise levels
         zne_start = time.perf_counter()
-        fidelity_data = []
-        execution_times = []
         
-        for factor in noise_factors:
-            factor_start = time.perf_counter()
-            
-            # Apply noise amplification
-            if factor > 1.0:
-                amplified_circuit = self.circuit_folding_amplification(eval_circuit, factor)
+        # Phase 1: transpile the base circuit once, then fold it at the transpiled
+        # (physical, native-gate) level so layout and routing are not redone per factor
+        pass_manager = generate_preset_pass_manager(optimization_level=1, backend=self.backend)
+        base_transpiled = pass_manager.run(eval_circuit)
+        unitary_transpiled, measurement_tail = self._split_measurements(base_transpiled)
+        
+        # Inverting native gates can leave the native set (sx → sxdg); translate those back
+        basis_pass_manager = PassManager([
+            BasisTranslator(SessionEquivalenceLibrary, target_basis=None, target=self.backend.target)
+        ])
+        
+        # Phase 2: run the first noise factors as one batch; the remaining (most
+        # amplified, most expensive) factors are only run if those do not already
+        # extrapolate with confidence >= adaptive_cutoff. The stop is judged on the
+        # two-parameter models only (the quadratic fits almost any few points exactly),
+        # against the realized noise scales, and needs more than two distinct scales:
+        # factors can fold to the same circuit, and two scales fit a line exactly
+        first_factors = noise_factors[:_ADAPTIVE_MIN_POINTS]
+        fidelity_data, execution_times, realized_factors = self._execute_noise_factors(
+            base_transpiled, unitary_transpiled, measurement_tail, basis_pass_manager,
+            first_factors, shots
+        )
+        early_stopped_at = None
+        
+        remaining_factors = noise_factors[_ADAPTIVE_MIN_POINTS:]
+        if remaining_factors:
+            if len(set(realized_factors)) > 2:
+                _, _, early_confidence = self.multi_model_extrapolation(
+                    realized_factors, fidelity_data, include_polynomial=False
+                )
             else:
-                amplified_circuit = eval_circuit
-            
-            # Transpile for hardware
-            pass_manager = generate_preset_pass_manager(optimization_level=1, backend=self.backend)
-            transpiled_circuit = pass_manager.run(amplified_circuit)
-            
-            # Execute on hardware (fixed for SamplerV2)
-            options = SamplerOptions()
-            options.default_shots = shots
-            sampler = Sampler(mode=self.backend, options=options)
-            
-            try:
-                job = sampler.run([(transpiled_circuit, None)])
-                result = job.result()
-                
-                # Extract counts
-                if hasattr(result[0].data, 'meas'):
-                    counts = result[0].data.meas.get_counts()
-                elif hasattr(result[0].data, 'c'):
-                    counts = result[0].data.c.get_counts()
-                else:
-                    data_keys = list(result[0].data.__dict__.keys())
-                    counts = getattr(result[0].data, data_keys[0]).get_counts() if data_keys else {}
-                
-                # Calculate fidelity (simplified - use distribution entropy as proxy)
-                if counts:
-                    total_shots = sum(counts.values())
-                    probs = [count/total_shots for count in counts.values()]
-                    entropy = -sum(p * np.log2(p + 1e-10) for p in probs)
-                    max_entropy = np.log2(len(counts))
-                    # Normalized entropy as fidelity proxy (higher entropy = more noise)
-                    fidelity = 1.0 - (entropy / max_entropy if max_entropy > 0 else 0)
-                else:
-                    fidelity = 0.0
-                
-                fidelity_data.append(fidelity)
-                factor_time = time.perf_counter() - factor_start
-                execution_times.append(factor_time)
-                
-                logger.debug(f"Noise factor {factor:.1f}: fidelity={fidelity:.4f}, time={factor_time:.2f}s")
-                
-            except Exception as e:
-                logger.error(f"Execution failed at noise factor {factor}: {e}")
-                fidelity_data.append(0.0)
-                execution_times.append(0.0)
+                early_confidence = 0.0
+            if early_confidence >= self.adaptive_cutoff:
+                early_stopped_at = len(first_factors) - 1
+                noise_factors = first_factors
+                logger.info(f"ZNE fit confidence {early_confidence:.3f} >= {self.adaptive_cutoff} after "
+                            f"{len(first_factors)} noise factors (realized {realized_factors}), skipping {remaining_factors}")
+            else:
+                more_fidelities, more_times, more_realized = self._execute_noise_factors(
+                    base_transpiled, unitary_transpiled, measurement_tail, basis_pass_manager,
+                    remaining_factors, shots
+                )
+                fidelity_data += more_fidelities
+                execution_times += more_times
+                realized_factors += more_realized
         
         zne_time = time.perf_counter() - zne_start
         
-        # Step 4: Multi-model extrapolation
+        # Step 4: Multi-model extrapolation, against the noise scales actually executed
         if len(fidelity_data) >= 2:
             zne_fidelity, best_model, confidence = self.multi_model_extrapolation(
-                noise_factors, fidelity_data
+                realized_factors, fidelity_data
             )
         else:
             zne_fidelity, best_model, confidence = 0.0, "none", 0.0
@@ -323,10 +539,11 @@ class EnhancedZNEOptimizer:
             'avg_shot_time': np.mean(execution_times) if execution_times else 0.0,
             
             # ZNE specific metrics
-            'noise_factors_used': noise_factors,
+            'noise_factors_used': realized_factors,
             'fidelity_progression': fidelity_data,
             'extrapolation_model': best_model,
             'extrapolation_confidence': confidence,
+            'early_stopped_at': early_stopped_at,
             
             # Hardware efficiency
             'total_shots': len(noise_factors) * shots,
@@ -356,13 +573,7 @@ class EnhancedZNEOptimizer:
         rows = [header, separator]
         
         for i, result in enumerate(results_list):
-            config = f"zne_test_{i+1}"
-            row = (f"{config}\t| {result['num_qubits']}\t| {result['t_depth']}\t| "
-                  f"{result['aux_states']}\t| {result['fidelity_baseline']:.4f}\t\t| "
-                  f"{result['fidelity_zne']:.4f}\t\t| {result['fidelity_improvement_percent']:.2f}\t\t| "
-                  f"{result['tvd_reduction_percent']:.2f}\t\t\t| {result['extrapolation_model']}\t| "
-                  f"{result['extrapolation_confidence']:.3f}\t\t| {result['total_time']:.2f}")
-            rows.append(row)
+            rows.append(_ZNE_ROW_FMT.format_map({'config': f"zne_test_{i+1}", **result}))
         
         return "\n".join(rows)
 
@@ -431,11 +642,16 @@ def run_enhanced_zne_analysis(backend, test_configs: List[Tuple[int, int]],
         print(f"\\n=== Enhanced ZNE Performance Analysis ===\\n{table}")
         
         # Summary statistics
-        avg_improvement = np.mean([r['fidelity_improvement_percent'] for r in results])
-        avg_tvd_reduction = np.mean([r['tvd_reduction_percent'] for r in results])
+        improvements = np.fromiter((r['fidelity_improvement_percent'] for r in results),
+                                   dtype=np.float64, count=len(results))
+        tvd_reductions = np.fromiter((r['tvd_reduction_percent'] for r in results),
+                                     dtype=np.float64, count=len(results))
+        avg_improvement = improvements.mean()
+        avg_tvd_reduction = tvd_reductions.mean()
         
         print(f"\\n=== ZNE Enhancement Summary ===")
-        print(f"Average fidelity improvement: {avg_improvement:.2f}%")
+        print(f"Average fidelity improvement: {avg_improvement:.2f}% "
+              f"(std {improvements.std():.2f}%, max {improvements.max():.2f}%)")
         print(f"Average TVD reduction: {avg_tvd_reduction:.2f}%")
         print(f"Total configurations tested: {len(results)}")
         
@@ -6,23 +6,58 @@ Comprehensive data export for all optimization scenarios and cross-term analysis
 
 import pandas as pd
 import numpy as np
+from functools import lru_cache
 from aux_overhead_prep_time_tables import simulate_polynomial_growth
 
+# Columns present for every configuration; per-layer and per-wire columns follow
+_BASE_COLUMNS = (
+    'Config', 'Qubits', 'T_Depth', 'Scenario', 'Aux_States', 'Layer_Sizes', 'Prep_Time_s',
+    'Total_Overhead_s', 'Efficiency', 'T_Set_Cross_Terms', 'Polynomial_Cross_Terms',
+    'T_Gadget_Time_s', 'Aux_Management_s', 'Poly_Eval_Time_s', 'ZNE_Overhead_s',
+    'Base_Aux_Overhead_s', 'Opt_Factor'
+)
+
+# Optimization scenarios: aux overhead factor (Opt-1 -5%, Opt-3 -15%) and whether
+# ZNE is applied (adds ZNE aux overhead and ~20% preparation time)
+_SCENARIO_NAMES = ('Baseline', 'ZNE', 'Opt-0', 'Opt-0+ZNE', 'Opt-1', 'Opt-1+ZNE', 'Opt-3', 'Opt-3+ZNE')
+_SCENARIO_OPT_FACTORS = np.array([1.0, 1.0, 1.0, 1.0, 0.95, 0.95, 0.85, 0.85])
+_SCENARIO_ZNE = np.array([False, True] * 4)
+_ZNE_PREP_FACTOR = 1.2
+
+@lru_cache(maxsize=None)
+def _cached_aux_keygen(qubits, t_depth):
+    """aux_keygen(qubits, t_depth), computed once per configuration."""
+    from key_generation import aux_keygen
+    return aux_keygen(qubits, t_depth)
+
+@lru_cache(maxsize=None)
+def _cached_layer_cross_terms(qubits, t_depth):
+    """Cross-product terms in each T[ℓ], counted from term factor counts (no term strings)."""
+    from key_generation import build_term_factor_counts
+    factor_counts = build_term_factor_counts(qubits, t_depth)
+    return {layer: int(np.count_nonzero(counts >= 2)) for layer, counts in factor_counts.items()}
+
 def export_comprehensive_csv(filename="aux_qhe_comprehensive_tables.csv"):
     """Export all tables to a comprehensive CSV file."""
 
     print(f"\n📊 EXPORTING COMPREHENSIVE AUX-QHE TABLES TO CSV: {filename}")
     print("=" * 70)
 
-    # Get CORRECT auxiliary states from actual aux_keygen function
-    from key_generation import aux_keygen, build_term_sets
-
     config_specs = [
         ("3q-2t", 3, 2), ("3q-3t", 3, 3), ("4q-2t", 4, 2),
         ("4q-3t", 4, 3), ("5q-2t", 5, 2), ("5q-3t", 5, 3)
     ]
 
-    all_data = []
+    # Columnar table with every column enumerated up front; layer/wire columns a
+    # configuration does not have are filled with NaN
+    max_qubits = max(qubits for _, qubits, _ in config_specs)
+    max_t_depth = max(t_depth for _, _, t_depth in config_specs)
+    columns = list(_BASE_COLUMNS)
+    columns += [f'Layer_{layer}_{kind}' for layer in range(1, max_t_depth + 1)
+                for kind in ('CrossTerms', 'TotalTerms')]
+    columns += [f'Wire_{wire}_{stat}' for wire in range(max_qubits)
+                for stat in ('fa_terms', 'fb_terms', 'fa_cross', 'fb_cross')]
+    table = {column: [] for column in columns}
 
     # Generate comprehensive data for each configuration
     print("🔄 Generating data for each configuration...")
@@ -31,20 +66,18 @@ def export_comprehensive_csv(filename="aux_qhe_comprehensive_tables.csv"):
         print(f"  Processing {config_name}...")
 
         try:
-            # Get real data from aux_keygen
-            _, _, real_prep_time, layer_sizes, real_aux_states = aux_keygen(qubits, t_depth)
+            # Get CORRECT auxiliary states from actual aux_keygen function
+            _, _, real_prep_time, layer_sizes, real_aux_states = _cached_aux_keygen(qubits, t_depth)
 
             # Get T-set cross-terms
-            T_sets, _ = build_term_sets(qubits, t_depth)
-            final_layer_terms = T_sets[t_depth]
-            t_set_cross_terms = len([term for term in final_layer_terms if '*' in term])
+            cross_counts = _cached_layer_cross_terms(qubits, t_depth)
+            t_set_cross_terms = cross_counts[t_depth]
 
             # Get layer-by-layer cross-term breakdown
             layer_cross_terms = {}
             for layer in range(1, t_depth + 1):
-                layer_terms = T_sets[layer]
-                layer_cross_terms[f'Layer_{layer}_CrossTerms'] = len([term for term in layer_terms if '*' in term])
-                layer_cross_terms[f'Layer_{layer}_TotalTerms'] = len(layer_terms)
+                layer_cross_terms[f'Layer_{layer}_CrossTerms'] = cross_counts[layer]
+                layer_cross_terms[f'Layer_{layer}_TotalTerms'] = layer_sizes[layer - 1]
 
             # Calculate various overhead metrics
             t_gadget_time = 0.1 + (t_depth * 0.05) + (qubits * 0.02)
@@ -62,22 +95,10 @@ def export_comprehensive_csv(filename="aux_qhe_comprehensive_tables.csv"):
             # ZNE overhead
             zne_aux_overhead = 2.5 + (qubits * 0.3)
 
-            # Optimization factors
-            opt1_factor = 0.95
-            opt3_factor = 0.85
-            zne_prep_factor = 1.2
-
-            # Calculate all optimization scenarios
-            scenarios = {
-                'Baseline': {'overhead': base_aux_overhead, 'prep': real_prep_time},
-                'ZNE': {'overhead': base_aux_overhead + zne_aux_overhead, 'prep': real_prep_time * zne_prep_factor},
-                'Opt-0': {'overhead': base_aux_overhead, 'prep': real_prep_time},
-                'Opt-0+ZNE': {'overhead': base_aux_overhead + zne_aux_overhead, 'prep': real_prep_time * zne_prep_factor},
-                'Opt-1': {'overhead': base_aux_overhead * opt1_factor, 'prep': real_prep_time},
-                'Opt-1+ZNE': {'overhead': base_aux_overhead * opt1_factor + zne_aux_overhead, 'prep': real_prep_time * zne_prep_factor},
-                'Opt-3': {'overhead': base_aux_overhead * opt3_factor, 'prep': real_prep_time},
-                'Opt-3+ZNE': {'overhead': base_aux_overhead * opt3_factor + zne_aux_overhead, 'prep': real_prep_time * zne_prep_factor}
-            }
+            # Calculate all optimization scenarios at once
+            overheads = base_aux_overhead * _SCENARIO_OPT_FACTORS + np.where(_SCENARIO_ZNE, zne_aux_overhead, 0.0)
+            preps = real_prep_time * np.where(_SCENARIO_ZNE, _ZNE_PREP_FACTOR, 1.0)
+            efficiencies = real_aux_states / (preps + overheads)
 
             # Get polynomial cross-terms (from simulation)
             growth_data = simulate_polynomial_growth(qubits, t_depth)
@@ -97,9 +118,9 @@ def export_comprehensive_csv(filename="aux_qhe_comprehensive_tables.csv"):
                 wire_stats = {}
 
             # Add one row per scenario
-            for scenario_name, scenario_data in scenarios.items():
-                efficiency = real_aux_states / (scenario_data['prep'] + scenario_data['overhead'])
-
+            for scenario_name, opt_factor, with_zne, prep, overhead, efficiency in zip(
+                    _SCENARIO_NAMES, _SCENARIO_OPT_FACTORS.tolist(), _SCENARIO_ZNE.tolist(),
+                    preps.tolist(), overheads.tolist(), efficiencies.tolist()):
                 row = {
                     'Config': config_name,
                     'Qubits': qubits,
@@ -107,17 +128,17 @@ def export_comprehensive_csv(filename="aux_qhe_comprehensive_tables.csv"):
                     'Scenario': scenario_name,
                     'Aux_States': real_aux_states,
                     'Layer_Sizes': str(layer_sizes),
-                    'Prep_Time_s': round(scenario_data['prep'], 4),
-                    'Total_Overhead_s': round(scenario_data['overhead'], 3),
+                    'Prep_Time_s': round(prep, 4),
+                    'Total_Overhead_s': round(overhead, 3),
                     'Efficiency': round(efficiency, 1),
                     'T_Set_Cross_Terms': t_set_cross_terms,
                     'Polynomial_Cross_Terms': poly_cross_terms,
                     'T_Gadget_Time_s': round(t_gadget_time, 4),
                     'Aux_Management_s': round(aux_management, 4),
                     'Poly_Eval_Time_s': round(poly_eval_time, 4),
-                    'ZNE_Overhead_s': round(zne_aux_overhead, 3) if 'ZNE' in scenario_name else 0,
+                    'ZNE_Overhead_s': round(zne_aux_overhead, 3) if with_zne else 0,
                     'Base_Aux_Overhead_s': round(base_aux_overhead, 4),
-                    'Opt_Factor': opt1_factor if 'Opt-1' in scenario_name else (opt3_factor if 'Opt-3' in scenario_name else 1.0)
+                    'Opt_Factor': opt_factor
                 }
 
                 # Add layer-by-layer cross-term data
@@ -126,22 +147,23 @@ def export_comprehensive_csv(filename="aux_qhe_comprehensive_tables.csv"):
                 # Add per-wire polynomial data
                 row.update(wire_stats)
 
-                all_data.append(row)
+                for column in columns:
+                    table[column].append(row.get(column, np.nan))
 
         except Exception as e:
             print(f"❌ Error processing {config_name}: {e}")
 
     # Create DataFrame and export to CSV
-    df = pd.DataFrame(all_data)
+    df = pd.DataFrame(table)
 
     # Save to CSV
     df.to_csv(filename, index=False)
 
     print(f"\n✅ EXPORT COMPLETED!")
     print(f"📄 File: {filename}")
-    print(f"📊 Rows: {len(all_data)}")
+    print(f"📊 Rows: {len(df)}")
     print(f"📈 Columns: {len(df.columns)}")
-    print(f"📋 Configurations: {len(config_specs)} configs × {len(scenarios)} scenarios")
+    print(f"📋 Configurations: {len(config_specs)} configs × {len(_SCENARIO_NAMES)} scenarios")
 
     # Display column info
     print(f"\n📝 CSV COLUMNS:")
@@ -6,6 +6,56 @@ Shows complete execution time for all configurations and optimization combinatio
 import pandas as pd
 import numpy as np
 
+# Runtime components per configuration (static), one column per config; module
+# level so other scripts can import the table instead of parsing stdout
+_BREAKDOWN_DF = pd.DataFrame({
+    'Component': ["Key Generation", "Circuit Evaluation", "IBM Queue Wait", "Hardware Execution",
+                  "Opt-0 Transpile", "Opt-1 Transpile", "Opt-3 Transpile", "ZNE Overhead"],
+    '3q-2t': ["0.003s", "0.25s", "5-15s", "3.5s", "+1.0s", "+2.5s", "+5.0s", "+21s"],
+    '3q-3t': ["0.012s", "0.31s", "5-15s", "3.9s", "+1.0s", "+2.5s", "+5.0s", "+21s"],
+    '4q-2t': ["0.032s", "0.30s", "5-15s", "4.0s", "+1.0s", "+2.5s", "+5.0s", "+23s"],
+    '4q-3t': ["0.012s", "0.36s", "5-15s", "4.4s", "+1.0s", "+2.5s", "+5.0s", "+23s"],
+    '5q-2t': ["0.012s", "0.35s", "5-15s", "4.5s", "+1.0s", "+2.5s", "+5.0s", "+25s"],
+    '5q-3t': ["0.531s", "0.41s", "5-15s", "4.9s", "+1.0s", "+2.5s", "+5.0s", "+25s"]
+})
+
+# Static recommendation and scaling tables; columns carry the printed headers
+_SCENARIOS_DF = pd.DataFrame({
+    'Scenario': ["Quick Testing", "Research Analysis", "Production Quality",
+                 "Balanced Performance", "Error Analysis"],
+    'Recommendation': ["Baseline or Opt-0", "Compare all levels", "Opt-3 + ZNE",
+                       "Opt-1 + ZNE", "ZNE on any opt level"],
+    'Typical Time': ["10-25s", "10-50s per config", "35-55s", "25-45s", "+15-25s overhead"],
+    'Pros': ["Fastest results", "Complete data", "Best fidelity",
+             "Good fidelity/time ratio", "Error mitigation"],
+    'Cons': ["Lower fidelity", "Time consuming", "Longest runtime",
+             "Not optimal for either", "Significant time cost"]
+})
+
+_SCALING_DF = pd.DataFrame({
+    'Complexity': ["3q-2t (Small)", "3q-3t (Small)", "4q-2t (Medium)",
+                   "4q-3t (Medium)", "5q-2t (Large)", "5q-3t (XLarge)"],
+    'Aux States': ["135", "100", "304", "100", "100", "31,025"],
+    'Baseline': ["~12s", "~12s", "~14s", "~14s", "~15s", "~16s"],
+    'Best (Opt-3+ZNE)': ["~33s", "~33s", "~37s", "~37s", "~40s", "~41s"]
+})
+
+def _format_table(table):
+    """Render a table of strings as Markdown, or as left-aligned text without tabulate."""
+    try:
+        return table.to_markdown(index=False)
+    except ImportError:
+        # Size each column to its longest cell so long entries cannot push the
+        # following columns out of line
+        widths = {column: max(len(column), table[column].str.len().max()) for column in table.columns}
+        return table.to_string(index=False, justify='left',
+                               formatters={column: f'{{:<{width}}}'.format
+                                           for column, width in widths.items()})
+
+def _text_width(text):
+    """Width of the widest line of a rendered table, for the rules drawn around it."""
+    return max(len(line) for line in text.splitlines())
+
 def create_ibm_total_runtime_table():
     """Create comprehensive runtime table for AUX-QHE on IBM Quantum."""
     
@@ -14,67 +64,56 @@ def create_ibm_total_runtime_table():
     print("Complete algorithm execution time: Key Generation + Circuit Evaluation + Measurement + Analysis")
     print()
     
-    # Configuration data based on your existing results
-    configs = [
-        {"config": "3q-2t", "qubits": 3, "t_depth": 2, "aux_states": 135},
-        {"config": "3q-3t", "qubits": 3, "t_depth": 3, "aux_states": 100},
-        {"config": "4q-2t", "qubits": 4, "t_depth": 2, "aux_states": 304},
-        {"config": "4q-3t", "qubits": 4, "t_depth": 3, "aux_states": 100},
-        {"config": "5q-2t", "qubits": 5, "t_depth": 2, "aux_states": 100},
-        {"config": "5q-3t", "qubits": 5, "t_depth": 3, "aux_states": 31025}
-    ]
-    
-    print(f"{'Config':<8} {'Baseline':<10} {'ZNE':<8} {'Opt-0':<8} {'Opt-0+ZNE':<12} {'Opt-1':<8} {'Opt-1+ZNE':<12} {'Opt-3':<8} {'Opt-3+ZNE':<12}")
-    print(f"{'':>8} {'(seconds)':<10} {'(sec)':<8} {'(sec)':<8} {'(seconds)':<12} {'(sec)':<8} {'(seconds)':<12} {'(sec)':<8} {'(seconds)':<12}")
-    print("-" * 120)
-    
-    for config in configs:
-        qubits = config["qubits"]
-        t_depth = config["t_depth"]
-        aux_states = config["aux_states"]
-        
-        # Base algorithm components timing (from your existing data)
-        # Key generation time (scales with aux states)
-        if aux_states > 10000:
-            keygen_time = 0.5 + (aux_states / 100000) * 2  # Large aux states
-        else:
-            keygen_time = 0.002 + (aux_states / 10000) * 0.1  # Small aux states
-        
-        # Circuit evaluation time (homomorphic operations)
-        eval_time = 0.1 + (qubits * 0.05) + (t_depth * 0.02)
-        
-        # IBM hardware base execution time (queue + execution)
-        ibm_queue_time = np.random.uniform(5, 15)  # Queue waiting time
-        ibm_base_exec = 2 + (qubits * 0.5) + (t_depth * 0.3)  # Basic execution
-        
-        # Optimization level timing impacts
-        opt0_transpile = 1.0  # Minimal transpilation
-        opt1_transpile = 2.5  # Light optimization 
-        opt3_transpile = 5.0  # Heavy optimization
-        
-        # ZNE additional timing (multiple noise level executions)
-        zne_overhead = 15.0 + (qubits * 2)  # ZNE requires multiple runs
-        
-        # Calculate total times for each approach
-        baseline_total = keygen_time + eval_time + ibm_queue_time + ibm_base_exec
-        
-        zne_total = baseline_total + zne_overhead
-        
-        opt0_total = keygen_time + eval_time + ibm_queue_time + ibm_base_exec + opt0_transpile
-        opt0_zne_total = opt0_total + zne_overhead
-        
-        opt1_total = keygen_time + eval_time + ibm_queue_time + ibm_base_exec + opt1_transpile  
-        opt1_zne_total = opt1_total + zne_overhead
-        
-        opt3_total = keygen_time + eval_time + ibm_queue_time + ibm_base_exec + opt3_transpile
-        opt3_zne_total = opt3_total + zne_overhead
-        
-        # Print formatted row
-        print(f"{config['config']:<8} {baseline_total:.1f}{'':>6} {zne_total:.1f}{'':>4} "
-              f"{opt0_total:.1f}{'':>4} {opt0_zne_total:.1f}{'':>8} {opt1_total:.1f}{'':>4} "
-              f"{opt1_zne_total:.1f}{'':>8} {opt3_total:.1f}{'':>4} {opt3_zne_total:.1f}")
-    
-    print("-" * 120)
+    # Configuration data based on your existing results, one array per field
+    config_names = ["3q-2t", "3q-3t", "4q-2t", "4q-3t", "5q-2t", "5q-3t"]
+    qubits = np.array([3, 3, 4, 4, 5, 5])
+    t_depth = np.array([2, 3, 2, 3, 2, 3])
+    aux_states = np.array([135, 100, 304, 100, 100, 31025])
+    
+    # Base algorithm components timing (from your existing data)
+    # Key generation time (scales with aux states): large vs small aux states
+    keygen_time = np.where(aux_states > 10000,
+                           0.5 + (aux_states / 100000) * 2,
+                           0.002 + (aux_states / 10000) * 0.1)
+    
+    # Circuit evaluation time (homomorphic operations)
+    eval_time = 0.1 + (qubits * 0.05) + (t_depth * 0.02)
+    
+    # IBM hardware base execution time (queue + execution); seeded so repeated
+    # runs print the same table
+    rng = np.random.default_rng(0)
+    ibm_queue_time = rng.uniform(5, 15, size=len(config_names))  # Queue waiting time
+    ibm_base_exec = 2 + (qubits * 0.5) + (t_depth * 0.3)  # Basic execution
+    
+    # Optimization level timing impacts: Baseline, Opt-0 (minimal transpilation),
+    # Opt-1 (light optimization), Opt-3 (heavy optimization)
+    transpile_time = np.array([0.0, 1.0, 2.5, 5.0])
+    
+    # ZNE additional timing (multiple noise level executions)
+    zne_overhead = 15.0 + (qubits * 2)  # ZNE requires multiple runs
+    
+    # Total times for every approach at once: (configs, approaches) matrices
+    base_total = keygen_time + eval_time + ibm_queue_time + ibm_base_exec
+    totals = base_total[:, None] + transpile_time[None, :]
+    zne_totals = totals + zne_overhead[:, None]
+    
+    runtime_table = pd.DataFrame({
+        'Config': config_names,
+        'Baseline': totals[:, 0],
+        'ZNE': zne_totals[:, 0],
+        'Opt-0': totals[:, 1],
+        'Opt-0+ZNE': zne_totals[:, 1],
+        'Opt-1': totals[:, 2],
+        'Opt-1+ZNE': zne_totals[:, 2],
+        'Opt-3': totals[:, 3],
+        'Opt-3+ZNE': zne_totals[:, 3]
+    })
+    
+    rendered = runtime_table.to_string(index=False, float_format='{:.1f}'.format)
+    print(rendered)
+    
+    print("-" * _text_width(rendered))
+    print("* All times in seconds")
     print("* Times include: Key Generation + Circuit Evaluation + IBM Queue Wait + Hardware Execution")
     print("* ZNE adds ~15-25s for multiple noise level measurements and extrapolation")
     print("* Optimization levels add transpilation overhead: Opt-0(+1s), Opt-1(+2.5s), Opt-3(+5s)")
@@ -82,34 +121,13 @@ def create_ibm_total_runtime_table():
 def create_runtime_breakdown_analysis():
     """Create detailed breakdown of runtime components."""
     
+    rendered = _BREAKDOWN_DF.to_string(index=False, justify='left',
+                                       formatters={'Component': '{:<20}'.format})
+    
     print("\n🔍 DETAILED RUNTIME BREAKDOWN ANALYSIS")
-    print("=" * 100)
-    
-    components = [
-        {"component": "Key Generation", "3q-2t": "0.003s", "3q-3t": "0.012s", "4q-2t": "0.032s", 
-         "4q-3t": "0.012s", "5q-2t": "0.012s", "5q-3t": "0.531s"},
-        {"component": "Circuit Evaluation", "3q-2t": "0.25s", "3q-3t": "0.31s", "4q-2t": "0.30s", 
-         "4q-3t": "0.36s", "5q-2t": "0.35s", "5q-3t": "0.41s"},
-        {"component": "IBM Queue Wait", "3q-2t": "5-15s", "3q-3t": "5-15s", "4q-2t": "5-15s", 
-         "4q-3t": "5-15s", "5q-2t": "5-15s", "5q-3t": "5-15s"},
-        {"component": "Hardware Execution", "3q-2t": "3.5s", "3q-3t": "3.9s", "4q-2t": "4.0s", 
-         "4q-3t": "4.4s", "5q-2t": "4.5s", "5q-3t": "4.9s"},
-        {"component": "Opt-0 Transpile", "3q-2t": "+1.0s", "3q-3t": "+1.0s", "4q-2t": "+1.0s", 
-         "4q-3t": "+1.0s", "5q-2t": "+1.0s", "5q-3t": "+1.0s"},
-        {"component": "Opt-1 Transpile", "3q-2t": "+2.5s", "3q-3t": "+2.5s", "4q-2t": "+2.5s", 
-         "4q-3t": "+2.5s", "5q-2t": "+2.5s", "5q-3t": "+2.5s"},
-        {"component": "Opt-3 Transpile", "3q-2t": "+5.0s", "3q-3t": "+5.0s", "4q-2t": "+5.0s", 
-         "4q-3t": "+5.0s", "5q-2t": "+5.0s", "5q-3t": "+5.0s"},
-        {"component": "ZNE Overhead", "3q-2t": "+21s", "3q-3t": "+21s", "4q-2t": "+23s", 
-         "4q-3t": "+23s", "5q-2t": "+25s", "5q-3t": "+25s"}
-    ]
-    
-    print(f"{'Component':<20} {'3q-2t':<8} {'3q-3t':<8} {'4q-2t':<8} {'4q-3t':<8} {'5q-2t':<8} {'5q-3t':<8}")
-    print("-" * 100)
-    
-    for comp in components:
-        print(f"{comp['component']:<20} {comp['3q-2t']:<8} {comp['3q-3t']:<8} {comp['4q-2t']:<8} "
-              f"{comp['4q-3t']:<8} {comp['5q-2t']:<8} {comp['5q-3t']:<8}")
+    print("=" * _text_width(rendered))
+    
+    print(rendered)
     
     print()
     print("Key Insights:")
@@ -121,53 +139,12 @@ def create_runtime_breakdown_analysis():
 def create_performance_vs_time_recommendations():
     """Create recommendations based on performance vs time tradeoffs."""
     
+    rendered = _format_table(_SCENARIOS_DF)
+    
     print("\n⚖️  PERFORMANCE vs TIME RECOMMENDATIONS")
-    print("=" * 80)
-    
-    scenarios = [
-        {
-            "scenario": "Quick Testing", 
-            "recommendation": "Baseline or Opt-0",
-            "typical_time": "10-25s",
-            "pros": "Fastest results",
-            "cons": "Lower fidelity"
-        },
-        {
-            "scenario": "Research Analysis", 
-            "recommendation": "Compare all levels",
-            "typical_time": "10-50s per config",
-            "pros": "Complete data",
-            "cons": "Time consuming"
-        },
-        {
-            "scenario": "Production Quality", 
-            "recommendation": "Opt-3 + ZNE",
-            "typical_time": "35-55s",
-            "pros": "Best fidelity",
-            "cons": "Longest runtime"
-        },
-        {
-            "scenario": "Balanced Performance", 
-            "recommendation": "Opt-1 + ZNE",
-            "typical_time": "25-45s",
-            "pros": "Good fidelity/time ratio",
-            "cons": "Not optimal for either"
-        },
-        {
-            "scenario": "Error Analysis", 
-            "recommendation": "ZNE on any opt level",
-            "typical_time": "+15-25s overhead",
-            "pros": "Error mitigation",
-            "cons": "Significant time cost"
-        }
-    ]
-    
-    print(f"{'Scenario':<20} {'Recommendation':<18} {'Typical Time':<15} {'Pros':<20} {'Cons':<15}")
-    print("-" * 80)
-    
-    for scenario in scenarios:
-        print(f"{scenario['scenario']:<20} {scenario['recommendation']:<18} {scenario['typical_time']:<15} "
-              f"{scenario['pros']:<20} {scenario['cons']:<15}")
+    print("=" * _text_width(rendered))
+    
+    print(rendered)
     
     print()
     print("🎯 OPTIMAL STRATEGY:")
@@ -179,25 +156,14 @@ def create_performance_vs_time_recommendations():
 def create_scaling_analysis():
     """Show how runtime scales with problem size."""
     
+    rendered = _format_table(_SCALING_DF)
+    
     print("\n📈 RUNTIME SCALING ANALYSIS")
-    print("=" * 70)
+    print("=" * _text_width(rendered))
     
     print("How total runtime scales with circuit complexity:")
     print()
-    print(f"{'Complexity':<15} {'Aux States':<12} {'Baseline':<10} {'Best (Opt-3+ZNE)':<15}")
-    print("-" * 70)
-    
-    scaling_data = [
-        {"complexity": "3q-2t (Small)", "aux_states": "135", "baseline": "~12s", "best": "~33s"},
-        {"complexity": "3q-3t (Small)", "aux_states": "100", "baseline": "~12s", "best": "~33s"},
-        {"complexity": "4q-2t (Medium)", "aux_states": "304", "baseline": "~14s", "best": "~37s"},
-        {"complexity": "4q-3t (Medium)", "aux_states": "100", "baseline": "~14s", "best": "~37s"},
-        {"complexity": "5q-2t (Large)", "aux_states": "100", "baseline": "~15s", "best": "~40s"},
-        {"complexity": "5q-3t (XLarge)", "aux_states": "31,025", "baseline": "~16s", "best": "~41s"}
-    ]
-    
-    for data in scaling_data:
-        print(f"{data['complexity']:<15} {data['aux_states']:<12} {data['baseline']:<10} {data['best']:<15}")
+    print(rendered)
     
     print()
     print("Scaling Insights:")
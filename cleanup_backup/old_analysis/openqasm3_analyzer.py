@@ -4,27 +4,113 @@ Interactive analysis of OpenQASM 3 features and auxiliary states
 """
 
 import re
+import os
 import json
+import mmap
+import contextlib
+import functools
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-def analyze_openqasm3_file(file_path):
+import pandas as pd
+
+# Patterns are compiled once and each starts with a literal, which lets the regex
+# engine jump between candidate positions with a fast prefix search. A leading \b
+# defeats that search (every position is tried), so word boundaries are checked
+# with a lookbehind after the literal instead: h(?<!\wh) matches where \bh does.
+# They are bytes patterns so they run directly over the mmap'd file.
+_RE_CLASSICAL_TYPES = (
+    re.compile(rb'bit\[\d+\]'),
+    re.compile(rb'int\[\d+\]'),
+    re.compile(rb'const int'),
+    re.compile(rb'const bit')
+)
+_RE_FUNCTION = re.compile(rb'def\s+(\w+)\s*\([^)]*\)')
+_RE_STRUCT = re.compile(rb'struct\s+(\w+)\s*{')
+_RE_CONDITIONAL = re.compile(rb'if(?<!\wif)\s*\(')
+_RE_LOOP = re.compile(rb'for(?<!\wfor)\s+')
+_RE_INCLUDE = re.compile(rb'include\s+"([^"]+)"')
+
+_RE_TOTAL_AUX = re.compile(rb'total_aux_states\s*=\s*(\d+)')
+_RE_LAYER_SIZE = re.compile(rb'layer_(\d+)_size\s*=\s*(\d+)')
+_RE_LAYER_CROSS = re.compile(rb'layer_(\d+)_cross_terms\s*=\s*(\d+)')
+_RE_A_INIT = re.compile(rb'a_init\s*=\s*"([01]+)"')
+_RE_B_INIT = re.compile(rb'b_init\s*=\s*"([01]+)"')
+_RE_AUX_CORRECTION = re.compile(rb'aux_t|apply_aux_correction')
+
+_RE_GATES = {
+    'hadamard': re.compile(rb'h(?<!\wh)\s+q\['),
+    't_gate': re.compile(rb't(?<!\wt)\s+q\['),
+    'cnot': re.compile(rb'cx(?<!\wcx)\s+q\['),
+    'pauli_x': re.compile(rb'x(?<!\wx)\s+q\['),
+    'pauli_z': re.compile(rb'z(?<!\wz)\s+q\['),
+    'phase': re.compile(rb'p(?<!\wp)\s+q\[')
+}
+_RE_MEASURE = re.compile(rb'measure\s+q\[')
+
+# (pattern, kind) pairs for analyze_classical_data; 'const' captures (name, value),
+# the array kinds capture (width, name). The lookbehinds keep qubit[N] and uint[N]
+# declarations from being read as bit[N]/int[N] variables
+_RE_CLASSICAL_VARS = (
+    (re.compile(rb'bit(?<!\wbit)\[(\d+)\]\s+(\w+)'), 'bit'),
+    (re.compile(rb'int(?<!\wint)\[(\d+)\]\s+(\w+)'), 'int'),
+    (re.compile(rb'const\s+int\s+(\w+)\s*=\s*(\d+)'), 'const')
+)
+
+# The version statement may only be preceded by comments, so it sits in the first
+# few lines; the generators in core/ put ~150 bytes of comments ahead of it
+_HEADER_SCAN_BYTES = 1024
+
+# mmap has no count(), so newlines are counted over slices of this size
+_COUNT_CHUNK_BYTES = 1 << 20
+
+_RE_NON_EMPTY_LINE = re.compile(rb'(?m)^[ \t\r\f\v]*\S')
+_RE_COMMENT_LINE = re.compile(rb'(?m)^[ \t\r\f\v]*//')
+
+def _map_file(f):
+    """Map an open binary file read-only; mmap cannot map empty files, so those give b''."""
+    if os.fstat(f.fileno()).st_size == 0:
+        return contextlib.nullcontext(b'')
+    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+def analyze_openqasm3_file(file_path, display: bool = True):
     """
     Analyze OpenQASM 3 file and extract AUX-QHE specific information.
 
     Args:
         file_path (str): Path to OpenQASM 3 file
+        display (bool): Print the full per-file report; callers that render
+            their own summary pass False
 
     Returns:
         dict: Analysis results
     """
     try:
-        with open(file_path, 'r') as f:
-            content = f.read()
+        stat = os.stat(file_path)
 
-        print(f"🔍 Analyzing OpenQASM 3 File: {Path(file_path).name}")
-        print("=" * 60)
+        if display:
+            print(f"🔍 Analyzing OpenQASM 3 File: {Path(file_path).name}")
+            print("=" * 60)
 
-        analysis = {
+        # Unchanged files are served from the cache; callers get their own copy so
+        # mutating the result cannot alter what later calls see
+        analysis = _copy_analysis(_analyze_file_cached(os.fspath(file_path), stat.st_mtime_ns, stat.st_size))
+
+        if display:
+            display_analysis(analysis)
+        return analysis
+
+    except Exception as e:
+        print(f"❌ Analysis failed: {e}")
+        return None
+
+@functools.lru_cache(maxsize=32)
+def _analyze_file_cached(file_path, mtime_ns, size):
+    """Analyze file_path; mtime_ns and size only key the cache so edited files are re-read."""
+    # Scan the mapped bytes directly: no decoded str copy of the whole file,
+    # only the captured fields are decoded
+    with open(file_path, 'rb') as f, _map_file(f) as content:
+        return {
             'file_info': analyze_file_structure(content),
             'qasm3_features': analyze_qasm3_features(content),
             'aux_qhe_data': analyze_aux_qhe_data(content),
@@ -32,31 +118,39 @@ def analyze_openqasm3_file(file_path):
             'classical_data': analyze_classical_data(content)
         }
 
-        display_analysis(analysis)
-        return analysis
-
-    except Exception as e:
-        print(f"❌ Analysis failed: {e}")
-        return None
+def _copy_analysis(analysis):
+    """Copy an analysis dict down to its leaves (fields hold scalars, sets, or lists/dicts of scalars or flat dicts)."""
+    def copy_field(value):
+        if isinstance(value, set):
+            return set(value)
+        if isinstance(value, list):
+            return [dict(item) if isinstance(item, dict) else item for item in value]
+        if isinstance(value, dict):
+            return {key: dict(item) if isinstance(item, dict) else item for key, item in value.items()}
+        return value
+
+    return {section: {key: copy_field(value) for key, value in fields.items()}
+            for section, fields in analysis.items()}
+
+def _count_newlines(content):
+    """Count b'\\n' in bytes or an mmap with bytes.count on bounded slices."""
+    return sum(content[start:start + _COUNT_CHUNK_BYTES].count(b'\n')
+               for start in range(0, len(content), _COUNT_CHUNK_BYTES))
 
 def analyze_file_structure(content):
     """Analyze basic file structure."""
-    lines = content.split('\n')
-    non_empty_lines = [line for line in lines if line.strip()]
-    comment_lines = [line for line in lines if line.strip().startswith('//')]
-
     return {
-        'total_lines': len(lines),
-        'non_empty_lines': len(non_empty_lines),
-        'comment_lines': len(comment_lines),
+        'total_lines': _count_newlines(content) + 1,
+        'non_empty_lines': len(_RE_NON_EMPTY_LINE.findall(content)),
+        'comment_lines': len(_RE_COMMENT_LINE.findall(content)),
         'file_size': len(content),
-        'has_openqasm3_header': 'OPENQASM 3.0' in content
+        'has_openqasm3_header': content.find(b'OPENQASM 3.0', 0, _HEADER_SCAN_BYTES) != -1
     }
 
 def analyze_qasm3_features(content):
     """Analyze OpenQASM 3 specific features."""
     features = {
-        'classical_types': [],
+        'classical_types': set(),
         'functions': [],
         'structs': [],
         'conditionals': 0,
@@ -64,32 +158,24 @@ def analyze_qasm3_features(content):
         'includes': []
     }
 
-    # Find classical types
-    type_patterns = [
-        r'bit\[\d+\]',
-        r'int\[\d+\]',
-        r'const int',
-        r'const bit'
-    ]
-
-    for pattern in type_patterns:
-        matches = re.findall(pattern, content)
-        features['classical_types'].extend(matches)
+    # Find the distinct classical types in use
+    for pattern in _RE_CLASSICAL_TYPES:
+        features['classical_types'].update(match.decode() for match in set(pattern.findall(content)))
 
     # Find function definitions
-    func_matches = re.findall(r'def\s+(\w+)\s*\([^)]*\)', content)
+    func_matches = [name.decode() for name in _RE_FUNCTION.findall(content)]
     features['functions'] = func_matches
 
     # Find struct definitions
-    struct_matches = re.findall(r'struct\s+(\w+)\s*{', content)
+    struct_matches = [name.decode() for name in _RE_STRUCT.findall(content)]
     features['structs'] = struct_matches
 
     # Count conditionals and loops
-    features['conditionals'] = len(re.findall(r'\bif\s*\(', content))
-    features['loops'] = len(re.findall(r'\bfor\s+', content))
+    features['conditionals'] = len(_RE_CONDITIONAL.findall(content))
+    features['loops'] = len(_RE_LOOP.findall(content))
 
     # Find includes
-    include_matches = re.findall(r'include\s+"([^"]+)"', content)
+    include_matches = [path.decode() for path in _RE_INCLUDE.findall(content)]
     features['includes'] = include_matches
 
     return features
@@ -106,33 +192,33 @@ def analyze_aux_qhe_data(content):
     }
 
     # Extract auxiliary state count
-    aux_match = re.search(r'total_aux_states\s*=\s*(\d+)', content)
+    aux_match = _RE_TOTAL_AUX.search(content)
     if aux_match:
         aux_data['auxiliary_states'] = int(aux_match.group(1))
 
     # Extract layer information
-    layer_matches = re.findall(r'layer_(\d+)_size\s*=\s*(\d+)', content)
+    layer_matches = _RE_LAYER_SIZE.findall(content)
     for layer, size in layer_matches:
         aux_data['layers'].append({'layer': int(layer), 'size': int(size)})
 
     # Extract cross-terms
-    cross_matches = re.findall(r'layer_(\d+)_cross_terms\s*=\s*(\d+)', content)
+    cross_matches = _RE_LAYER_CROSS.findall(content)
     for layer, count in cross_matches:
         aux_data['cross_terms'][int(layer)] = int(count)
 
     # Extract QOTP keys
-    a_key_match = re.search(r'a_init\s*=\s*"([01]+)"', content)
-    b_key_match = re.search(r'b_init\s*=\s*"([01]+)"', content)
+    a_key_match = _RE_A_INIT.search(content)
+    b_key_match = _RE_B_INIT.search(content)
 
     if a_key_match and b_key_match:
         aux_data['qotp_keys'] = {
-            'a_init': a_key_match.group(1),
-            'b_init': b_key_match.group(1)
+            'a_init': a_key_match.group(1).decode(),
+            'b_init': b_key_match.group(1).decode()
         }
 
     # Count T-gates and auxiliary corrections
-    aux_data['t_gates'] = len(re.findall(r'\bt\s+q\[', content))
-    aux_data['aux_corrections'] = len(re.findall(r'aux_t|apply_aux_correction', content))
+    aux_data['t_gates'] = len(_RE_GATES['t_gate'].findall(content))
+    aux_data['aux_corrections'] = len(_RE_AUX_CORRECTION.findall(content))
 
     return aux_data
 
@@ -145,23 +231,14 @@ def analyze_circuit_operations(content):
     }
 
     # Common quantum gates
-    gate_patterns = {
-        'hadamard': r'\bh\s+q\[',
-        't_gate': r'\bt\s+q\[',
-        'cnot': r'\bcx\s+q\[',
-        'pauli_x': r'\bx\s+q\[',
-        'pauli_z': r'\bz\s+q\[',
-        'phase': r'\bp\s+q\['
-    }
-
-    for gate_name, pattern in gate_patterns.items():
-        count = len(re.findall(pattern, content))
+    for gate_name, pattern in _RE_GATES.items():
+        count = len(pattern.findall(content))
         if count > 0:
             operations['quantum_gates'][gate_name] = count
             operations['total_operations'] += count
 
     # Count measurements
-    operations['measurements'] = len(re.findall(r'measure\s+q\[', content))
+    operations['measurements'] = len(_RE_MEASURE.findall(content))
 
     return operations
 
@@ -175,20 +252,12 @@ def analyze_classical_data(content):
     }
 
     # Find classical variables
-    var_patterns = [
-        r'bit\[(\d+)\]\s+(\w+)',
-        r'int\[(\d+)\]\s+(\w+)',
-        r'const\s+int\s+(\w+)\s*=\s*(\d+)'
-    ]
-
-    for pattern in var_patterns:
-        matches = re.findall(pattern, content)
-        if 'bit[' in pattern:
-            classical['variables'].extend([{'type': f'bit[{m[0]}]', 'name': m[1]} for m in matches])
-        elif 'int[' in pattern:
-            classical['variables'].extend([{'type': f'int[{m[0]}]', 'name': m[1]} for m in matches])
-        elif 'const' in pattern:
+    for pattern, kind in _RE_CLASSICAL_VARS:
+        matches = [(m[0].decode(), m[1].decode()) for m in pattern.findall(content)]
+        if kind == 'const':
             classical['constants'].extend([{'name': m[0], 'value': m[1]} for m in matches])
+        else:
+            classical['variables'].extend([{'type': f'{kind}[{m[0]}]', 'name': m[1]} for m in matches])
 
     return classical
 
@@ -202,7 +271,7 @@ def display_analysis(analysis):
     print(f"📄 File Structure:")
     print(f"   Lines: {file_info['total_lines']} (non-empty: {file_info['non_empty_lines']})")
     print(f"   Comments: {file_info['comment_lines']}")
-    print(f"   Size: {file_info['file_size']} characters")
+    print(f"   Size: {file_info['file_size']} bytes")
     print(f"   OpenQASM 3: {'✅' if file_info['has_openqasm3_header'] else '❌'}")
 
     # OpenQASM 3 features
@@ -212,7 +281,7 @@ def display_analysis(analysis):
     print(f"   Structs: {len(qasm3['structs'])} {qasm3['structs']}")
     print(f"   Conditionals: {qasm3['conditionals']}")
     print(f"   Loops: {qasm3['loops']}")
-    print(f"   Classical types: {len(set(qasm3['classical_types']))}")
+    print(f"   Classical types: {len(qasm3['classical_types'])}")
 
     # AUX-QHE data
     aux = analysis['aux_qhe_data']
@@ -256,24 +325,39 @@ def interactive_qasm3_explorer():
 
     print("\nAnalyzing all available files...")
 
-    analyses = {}
-    for file_path in qasm_files:
-        if Path(file_path).exists():
-            print(f"\n{'='*60}")
-            analysis = analyze_openqasm3_file(file_path)
-            analyses[file_path] = analysis
+    # Analyze quietly and render one combined table instead of a full report per
+    # file followed by a summary repeating the same numbers
+    existing = [file_path for file_path in qasm_files if Path(file_path).exists()]
+    analyze = functools.partial(analyze_openqasm3_file, display=False)
+    workers = min(3, len(existing), os.cpu_count() or 1)
+    if workers > 1:
+        # The files are independent, so scan them in separate processes; results
+        # cached in the workers do not carry back, so single-core machines and
+        # single files stay in-process where the cache is reused across calls
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            analyses = dict(zip(existing, executor.map(analyze, existing)))
+    else:
+        analyses = {file_path: analyze(file_path) for file_path in existing}
 
     # Summary comparison
     print(f"\n{'='*20} COMPARISON SUMMARY {'='*20}")
-    for file_path, analysis in analyses.items():
-        if analysis:
-            filename = Path(file_path).name
-            aux_states = analysis['aux_qhe_data']['auxiliary_states']
-            total_ops = analysis['circuit_operations']['total_operations']
-            file_size = analysis['file_info']['file_size']
-
-            print(f"📊 {filename}:")
-            print(f"   Size: {file_size} chars, Aux states: {aux_states}, Operations: {total_ops}")
+    summary = pd.DataFrame([
+        {
+            'File': Path(file_path).name,
+            'Size (bytes)': analysis['file_info']['file_size'],
+            'OpenQASM 3': '✅' if analysis['file_info']['has_openqasm3_header'] else '❌',
+            'Aux states': analysis['aux_qhe_data']['auxiliary_states'],
+            'Layers': len(analysis['aux_qhe_data']['layers']),
+            'T gates': analysis['aux_qhe_data']['t_gates'],
+            'Operations': analysis['circuit_operations']['total_operations'],
+            'Measurements': analysis['circuit_operations']['measurements']
+        }
+        for file_path, analysis in analyses.items() if analysis
+    ])
+    if summary.empty:
+        print("No OpenQASM 3 files could be analyzed")
+    else:
+        print(summary.to_string(index=False))
 
     return analyses
 
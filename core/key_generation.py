@@ -8,6 +8,7 @@ corrected according to the theoretical pseudocode specification.
 import logging
 import time
 import random
+from itertools import combinations
 import numpy as np
 from qiskit import QuantumCircuit
 from qiskit.qasm3 import dumps
@@ -31,7 +32,7 @@ class AuxiliaryState:
         self.k_value = k_value  # k parameter from theory
         self.index = index      # (layer, wire, term)
 
-def build_term_sets(num_qubits, max_T_depth):
+def build_term_sets(num_qubits, max_T_depth, return_cross_counts=False):
     """
     Build term sets T[ℓ] for each T-layer according to theory.
     
@@ -44,12 +45,16 @@ def build_term_sets(num_qubits, max_T_depth):
     Args:
         num_qubits (int): Number of qubits n.
         max_T_depth (int): Maximum T-depth L.
+        return_cross_counts (bool): Also return the number of cross-product
+            terms in each T[ℓ], counted as the products are added.
     
     Returns:
-        dict: T[ℓ] term sets for each layer.
+        tuple: (T, V) term and variable sets for each layer, or
+            (T, V, cross_counts) if return_cross_counts is set.
     """
     T = {}
     V = {}  # Variable sets for each layer
+    cross_counts = {1: 0}  # Base variables are not cross-products
     
     # Layer 1: Base variables {a₁, ..., aₙ, b₁, ..., bₙ}
     T[1] = []
@@ -69,17 +74,12 @@ def build_term_sets(num_qubits, max_T_depth):
         V[ell] = V[ell-1].copy()
 
         # Add products t·t' for all pairs (t, t') in T[ℓ-1] where t ≠ t'
+        # (pairs come out of combinations() in the same i < j order)
         prev_terms = T[ell-1]
-        new_cross_terms = []
-
-        for i in range(len(prev_terms)):
-            for j in range(i+1, len(prev_terms)):
-                t1, t2 = prev_terms[i], prev_terms[j]
-                if t1 != t2:  # Ensure t ≠ t'
-                    cross_term = f"({t1})*({t2})"
-                    new_cross_terms.append(cross_term)
+        new_cross_terms = [f"({t1})*({t2})" for t1, t2 in combinations(prev_terms, 2) if t1 != t2]
 
         T[ell].extend(new_cross_terms)
+        cross_counts[ell] = cross_counts[ell-1] + len(new_cross_terms)
 
         # Add new key variables for this layer (from previous layer evaluation)
         for i in range(num_qubits):
@@ -92,8 +92,87 @@ def build_term_sets(num_qubits, max_T_depth):
         if ell <= 3:  # Log first few layers for debugging
             logger.debug(f"T[{ell}] = {T[ell][:10]}{'...' if len(T[ell]) > 10 else ''}")
     
+    if return_cross_counts:
+        return T, V, cross_counts
     return T, V
 
+def _kept_pairs(term_ids):
+    """
+    Index pairs (i < j) of a layer that build_term_sets turns into products.
+
+    build_term_sets skips pairs whose two terms are the same string, and
+    T[ℓ-1] repeats terms from T[3] on, so not every i < j pair is kept.
+
+    Args:
+        term_ids (np.ndarray): Term identities of T[ℓ-1] - equal exactly
+            where the term strings are equal.
+
+    Returns:
+        tuple: (i, j) index arrays in build_term_sets' pair order.
+    """
+    i, j = np.triu_indices(len(term_ids), k=1)  # Same pair order as combinations()
+    keep = term_ids[i] != term_ids[j]
+    return i[keep], j[keep]
+
+def build_term_factor_counts(num_qubits, max_T_depth):
+    """
+    Factor counts of the terms in T[ℓ], without building the term strings.
+
+    Structure-of-arrays companion to build_term_sets: entry t of layer ℓ is
+    the number of base variables multiplied together in T[ℓ][t]. It follows
+    the same layout - T[ℓ-1], then the products of the kept pairs (i < j,
+    T[ℓ-1][i] ≠ T[ℓ-1][j]), then n·|T[ℓ-1]| new k-variables - so a term is
+    a cross-product exactly when its factor count is at least 2.
+
+    Args:
+        num_qubits (int): Number of qubits n.
+        max_T_depth (int): Maximum T-depth L.
+
+    Returns:
+        dict: ℓ -> np.ndarray of factor counts, aligned with T[ℓ].
+    """
+    counts = {1: np.ones(2 * num_qubits, dtype=np.int64)}
+
+    # Term identities stand in for the strings: base and k-variables get fresh
+    # non-negative ids, a product "(t)*(t')" gets a negative id interned on
+    # (id(t), id(t')) so the same product added in two layers shares its id
+    term_ids = np.arange(2 * num_qubits, dtype=np.int64)
+    product_ids = {}
+    next_var_id = 2 * num_qubits
+
+    for ell in range(2, max_T_depth + 1):
+        prev = counts[ell-1]
+        i, j = _kept_pairs(term_ids)
+        new_ids = np.array([-1 - product_ids.setdefault(pair, len(product_ids))
+                            for pair in zip(term_ids[i].tolist(), term_ids[j].tolist())],
+                           dtype=np.int64)
+        num_k_vars = num_qubits * len(prev)
+
+        counts[ell] = np.concatenate([prev, prev[i] + prev[j],
+                                      np.ones(num_k_vars, dtype=np.int64)])
+        term_ids = np.concatenate([term_ids, new_ids,
+                                   np.arange(next_var_id, next_var_id + num_k_vars, dtype=np.int64)])
+        next_var_id += num_k_vars
+
+    return counts
+
+def aux_keygen_sizes(num_qubits, max_T_depth):
+    """
+    Number of auxiliary states aux_keygen would prepare, per layer.
+
+    Counts only - no term strings, term evaluation or auxiliary circuits -
+    for callers that need layer sizes but not the states themselves.
+
+    Args:
+        num_qubits (int): Number of qubits n.
+        max_T_depth (int): Maximum T-depth L.
+
+    Returns:
+        dict: ℓ -> n·|T[ℓ]| auxiliary states for that layer.
+    """
+    counts = build_term_factor_counts(num_qubits, max_T_depth)
+    return {ell: num_qubits * len(counts[ell]) for ell in range(1, max_T_depth + 1)}
+
 def evaluate_term(term, variable_values):
     """
     Evaluate a polynomial term using variable values.
@@ -189,6 +268,46 @@ def evaluate_term(term, variable_values):
     logger.warning(f"Could not evaluate term: {term}")
     return 0
 
+def evaluate_term_sets(T_sets, variable_values):
+    """
+    Evaluate every term of every T-layer, addressing terms by index.
+
+    Relies on the build_term_sets layout: T[ℓ] is T[ℓ-1], then the products
+    (T[ℓ-1][i])*(T[ℓ-1][j]) for the kept pairs i < j (equal terms are not
+    multiplied), then n·|T[ℓ-1]| new k-variables. A product's value is
+    therefore the product of its two parents' values mod 2 - the same
+    result evaluate_term gets by re-parsing the nested string - and each
+    term is evaluated once per layer instead of once per wire. A layer that
+    does not have this layout is evaluated term by term with evaluate_term.
+
+    Args:
+        T_sets (dict): Term sets from build_term_sets.
+        variable_values (dict): Values of the a, b and k variables.
+
+    Returns:
+        dict: ℓ -> np.ndarray of term values, aligned with T[ℓ].
+    """
+    num_qubits = len(T_sets[1]) // 2
+    values = {1: np.array([variable_values[term] for term in T_sets[1]], dtype=np.int64)}
+
+    for ell in range(2, max(T_sets) + 1):
+        prev = values[ell-1]
+        terms = T_sets[ell]
+        _, term_ids = np.unique(np.array(T_sets[ell-1]), return_inverse=True)
+        i, j = _kept_pairs(term_ids.ravel())
+        num_k_vars = num_qubits * len(prev)
+
+        if len(prev) + len(i) + num_k_vars != len(terms):
+            logger.warning(f"T[{ell}] does not follow the build_term_sets layout, evaluating its terms one by one")
+            values[ell] = np.array([evaluate_term(term, variable_values) for term in terms], dtype=np.int64)
+            continue
+
+        k_vars = terms[len(prev) + len(i):]
+        values[ell] = np.concatenate([prev, (prev[i] * prev[j]) % 2,
+                                      np.array([variable_values[k] for k in k_vars], dtype=np.int64)])
+
+    return values
+
 def prepare_auxiliary_state(s_value, k_value):
     """
     Prepare auxiliary state |+_{s,k}⟩ = Z^k P^s |+⟩.
@@ -281,8 +400,14 @@ def aux_keygen(num_qubits, max_T_depth, a_init=None, b_init=None):
 
         logger.debug(f"Pre-generated {len(k_values_dict)} k-variables deterministically")
 
+        # s values depend only on the term, so evaluate each term once per layer
+        term_values = evaluate_term_sets(T_sets, variable_values)
+
         # Generate auxiliary states for each layer, wire, and term
         auxiliary_states = {}
+        # |+_{s,k}⟩ only has four distinct circuits; build each once and share it
+        # between states (consumers copy or compose it, never modify it in place)
+        aux_circuits = {}
         k_dict = {}  # Store k values for secret key
         total_aux_states = 0
 
@@ -296,11 +421,13 @@ def aux_keygen(num_qubits, max_T_depth, a_init=None, b_init=None):
                     k_bytes = hashlib.md5(k_hash.encode()).digest()
                     k_value = k_bytes[0] % 2
 
-                    # Evaluate s value using current variable assignments
-                    s_value = evaluate_term(term, variable_values)
+                    # s value of this term under the current variable assignments
+                    s_value = int(term_values[ell][term_idx])
 
                     # Prepare auxiliary state |+_{s,k}⟩
-                    aux_circuit = prepare_auxiliary_state(s_value, k_value)
+                    aux_circuit = aux_circuits.get((s_value, k_value))
+                    if aux_circuit is None:
+                        aux_circuit = aux_circuits[(s_value, k_value)] = prepare_auxiliary_state(s_value, k_value)
 
                     # CRITICAL FIX: Index by (layer, wire, term_string) instead of term_idx
                     # This allows proper lookup by polynomial term
@@ -370,13 +497,18 @@ const int total_aux_states = {len(k_dict)};
 // T-set cross-terms by layer
 """
 
-        # Add T-sets data
+        # Add T-sets data; cross-terms are the terms with two or more factors
+        factor_counts = build_term_factor_counts(num_qubits, max_t_depth)
         for layer, terms in T_sets.items():
-            cross_terms = [term for term in terms if '*' in term]
+            counts = factor_counts.get(layer)
+            if counts is not None and len(counts) == len(terms):
+                num_cross_terms = int(np.count_nonzero(counts >= 2))
+            else:  # T-sets not laid out by build_term_sets - scan the strings
+                num_cross_terms = sum(1 for term in terms if '*' in term)
             qasm3_export += f"""
-// Layer {layer}: {len(terms)} total terms, {len(cross_terms)} cross-terms
+// Layer {layer}: {len(terms)} total terms, {num_cross_terms} cross-terms
 const int layer_{layer}_size = {len(terms)};
-const int layer_{layer}_cross_terms = {len(cross_terms)};
+const int layer_{layer}_cross_terms = {num_cross_terms};
 """
 
         # Add auxiliary state definitions
@@ -0,0 +1,18 @@
+"""
+Numba Compatibility Module
+
+This module provides numba's njit decorator when numba is installed and a
+no-op stand-in otherwise, so JIT-decorated kernels also run as plain Python.
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
@@ -7,6 +7,7 @@ corrected according to the theoretical specification with proper key updates.
 
 import logging
 import time
+from itertools import islice
 import numpy as np
 from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
 from qiskit.quantum_info import Statevector
@@ -107,23 +108,14 @@ def construct_auxiliary_for_polynomial(f_polynomial, auxiliary_states, layer, wi
             # CRITICAL FIX: Direct lookup using (layer, wire, term_string)
             lookup_key = (layer, wire, term)
 
+            # aux_keygen keys states by the exact T-set term string, which never
+            # carries surrounding whitespace, so a keyed lookup is exhaustive
             if lookup_key in auxiliary_states:
                 aux_state = auxiliary_states[lookup_key]
                 if debug:
                     logger.debug(f"Found auxiliary state for term '{term}' at layer={layer}, wire={wire}: k={aux_state.k_value}")
                 return aux_state.circuit.copy(), aux_state.k_value, []
 
-            # Fallback: Try to find by matching term string (handle variations)
-            for index, aux_state in auxiliary_states.items():
-                if isinstance(index, tuple) and len(index) >= 3:
-                    layer_idx, wire_idx, term_string = index[0], index[1], index[2]
-                    if layer_idx == layer and wire_idx == wire:
-                        # Normalize and compare term strings
-                        if term_string.strip() == term or term_string == term:
-                            if debug:
-                                logger.debug(f"Found auxiliary state via fallback for '{term}': k={aux_state.k_value}")
-                            return aux_state.circuit.copy(), aux_state.k_value, []
-
             # If single term not found in auxiliary_states, try to evaluate it
             # This handles cases like 'c0_1' which are variables, not base terms
             if term in variable_values:
@@ -139,7 +131,7 @@ def construct_auxiliary_for_polynomial(f_polynomial, auxiliary_states, layer, wi
 
             # If still not found, create a default auxiliary state
             logger.warning(f"No auxiliary state found for layer={layer}, wire={wire}, term='{term}'. Creating default.")
-            logger.warning(f"Available keys: {[k for k in auxiliary_states.keys() if k[0] == layer and k[1] == wire][:5]}")
+            logger.warning(f"Available keys: {list(islice((k for k in auxiliary_states if k[0] == layer and k[1] == wire), 5))}")
             qc = QuantumCircuit(1, name=f'aux_default_{term}')
             qc.h(0)  # |+⟩ state
             return qc, 0, []
@@ -167,19 +159,7 @@ def construct_auxiliary_for_polynomial(f_polynomial, auxiliary_states, layer, wi
                     continue
 
             # CRITICAL FIX: Lookup by term string, not index
-            lookup_key = (layer, wire, term)
-
-            if lookup_key in auxiliary_states:
-                aux_state = auxiliary_states[lookup_key]
-            else:
-                # Fallback: search for matching term
-                aux_state = None
-                for index, state in auxiliary_states.items():
-                    if isinstance(index, tuple) and len(index) >= 3:
-                        layer_idx, wire_idx, term_string = index[0], index[1], index[2]
-                        if layer_idx == layer and wire_idx == wire and term_string.strip() == term:
-                            aux_state = state
-                            break
+            aux_state = auxiliary_states.get((layer, wire, term))
 
             if aux_state is None:
                 logger.warning(f"No auxiliary state found for term '{term}' at layer={layer}, wire={wire}, skipping")